@@ -3,13 +3,28 @@
 #################
 #   imports
 
+import time
+
+# start of the script, reference of the --startup-timing report
+script_start_ts = time.time()
+
+# modules only needed by some options (hashlib, mmap, multiprocessing, pickle) are imported where they are used
 import argparse
-import array
+import atexit
+import bisect
+import collections
+import ctypes
+import errno
+import functools
 import logging
-import time
+import os
+import select
+import signal
+import threading
 # standard modules
-from socket import (socket, AF_INET, SOCK_DGRAM, SOL_SOCKET, SO_REUSEADDR, SO_BROADCAST)
-from struct import pack, unpack
+from socket import (socket, timeout, getaddrinfo, inet_aton, AF_INET, AF_UNSPEC, SOCK_DGRAM, IPPROTO_IP,
+                    IP_ADD_MEMBERSHIP, SOL_SOCKET, SO_REUSEADDR, SO_RCVBUF)
+from struct import Struct, pack, unpack, unpack_from, calcsize
 
 try:
     import configparser as configparser
@@ -17,13 +32,14 @@ except ImportError:
     import ConfigParser as configparser
 
 # 3rd party modules
-from oscpy.client import send_message as send_osc_message
+from oscpy.parser import format_message as format_osc_message
 
-ola_module_present = True
-try:
-    from ola.ClientWrapper import ClientWrapper
-except ImportError:
-    ola_module_present = False
+# optional modules are imported on demand, see load_ola_module() and load_numpy_module()
+ClientWrapper = None
+ola_module_present = None
+
+numpy = None
+numpy_module_present = False
 
 __version__ = "0.0.3"
 __version_date__ = "2019-07-31"
@@ -35,509 +51,4113 @@ __description__ = "script to receive dmx and send out osc commands to osc server
 
 artnet_udp_port = 6454
 ArtDmxPackage = 0x0050
+# ID, OpCode, ProtVer, Sequence, Physical, SubUni, Net and Length of an ArtDmx packet
+artnet_dmx_header_struct = Struct("!8sHHBBBBH")
+
+sacn_udp_port = 5568
+# E1.31 root and framing layer vectors of DMX data packets
+VECTOR_ROOT_E131_DATA = 0x00000004
+VECTOR_E131_DATA_PACKET = 0x00000002
+# preamble, root layer vector, CID and framing layer vector of a sACN packet
+sacn_layers_struct = Struct("!16s2xL16s2xL")
+# priority, sequence, options and universe of the framing layer, starting at offset 108
+sacn_framing_struct = Struct("!B2xBBH")
+# property value count and start code of the DMP layer, starting at offset 123
+sacn_dmp_struct = Struct("!HB")
+# E1.31 framing options
+SACN_OPTION_PREVIEW_DATA = 0x80
+SACN_OPTION_STREAM_TERMINATED = 0x40
+# valid sACN universes, every universe has its own multicast group 239.255.HI.LO
+sacn_min_universe = 1
+sacn_max_universe = 63999
+default_sacn_universe = 1
+default_sacn_listen_address = "0.0.0.0"
+# seconds without a packet after which a sACN source is considered lost (E1.31 network data loss)
+sacn_source_timeout = 2.5
+# packets with a sequence number up to this distance behind the last one are out of order
+sacn_sequence_reject_window = 20
 
 dmx_num_channels = 512
 
 default_config_file_path = "./dmx_to_osc.ini"
 default_dmx_universe = 0
+default_osc_output_mode = "message"
+# 1500 bytes ethernet MTU - 20 bytes IPv4 header - 8 bytes UDP header
+default_osc_bundle_max_size = 1472
+# max number of updates per second sent to an OSC destination, 0 means unlimited
+default_osc_max_rate = 0
 
-last_dmx_block = [0] * dmx_num_channels
-last_run_ts = None
-osc_handle = None
+# size of the chunks compared at once if numpy is not available
+dmx_compare_chunk_size = 32
 
+# scratch buffer to pad/convert incoming frames which are not exactly 512 bytes long
+dmx_frame_buffer = bytearray(dmx_num_channels)
+# frames of these types are used without copying, items of bytes and memoryview are str on python 2
+if bytes is str:
+    dmx_frame_types = (bytearray,)
+else:
+    dmx_frame_types = (memoryview, bytes, bytearray)
 
-class ArtnetPacket:
-    ARTNET_HEADER = b'Art-Net\x00'
+# how packets of multiple Art-Net senders of the same universe are combined
+#   none: packets of the first sender are accepted until it times out
+#   htp: highest value of all senders takes precedence
+#   ltp: latest change of any sender takes precedence
+artnet_merge_modes = ["none", "htp", "ltp"]
+default_artnet_merge_mode = "none"
+# max number of senders merged per universe
+default_artnet_merge_sources = 2
+# seconds without a packet after which a sender is forgotten
+default_artnet_source_timeout = 10.0
+# sequence numbers up to this distance ahead of the last one are considered newer, all others are stale
+artnet_sequence_window = 127
 
-    def __init__(self):
-        self.op_code = None
-        self.ver = None
-        self.sequence = None
-        self.physical = None
-        self.universe = None
-        self.net = None
-        self.subuni = None
-        self.length = None
-        self.data = None
-
-    def __str__(self):
-        return ("ArtNet package:\n - op_code: 0x{0}\n - version: {1}\n - "
-                "sequence: {2}\n - physical: {3}\n - net: {4}\n - subuni: {5}\n -"
-                "length: {6}\n - data : {7}").format(
-            '{:02x}'.format(self.op_code), self.ver, self.sequence, self.physical,
-            self.net, self.subuni, self.length, self.data)
+# seconds between checks if all OSC worker processes are still alive
+osc_worker_supervise_interval = 1.0
 
-    @staticmethod
-    def unpack_raw_artnet_packet(raw_data):
+default_metrics_listen_address = "127.0.0.1"
+default_metrics_port = 9101
+# seconds between metrics summary log lines if started with --profile and no log_interval is configured
+default_metrics_profile_interval = 5
 
-        if unpack('!8s', raw_data[:8])[0] != ArtnetPacket.ARTNET_HEADER:
-            print("Received a non Art-Net packet")
-            return None
+# reasons input packets get dropped
+packet_drop_reasons = ["non_artnet", "non_sacn", "malformed", "not_artdmx", "not_dmx", "wrong_source",
+                       "low_priority", "stream_terminated", "duplicate_sequence", "stale_sequence", "wrong_universe"]
 
-        packet = ArtnetPacket()
-        try:
-            (packet.op_code, packet.ver, packet.sequence, packet.physical,
-             packet.subuni, packet.net, packet.length) = unpack('!HHBBBBH', raw_data[8:18])
-        except Exception:
-            return None
+# capture file format: magic, followed by records of a header and a payload. frame records
+# contain runs of channels which changed since the previous frame of the same universe,
+# a session record starts a new capture session which resets all frames to zero
+capture_file_magic = b"DMXCAP\x00\x01"
+# record type, timestamp, universe, payload length
+capture_record_format = "!BdHH"
+capture_record_size = calcsize(capture_record_format)
+# start channel id and length of a run of changed channels
+capture_run_format = "!HH"
+capture_run_size = calcsize(capture_run_format)
+# unchanged channels between two runs up to this number get merged into a single run
+capture_run_merge_gap = capture_run_size
+# seconds between flushing the capture file to disk
+capture_flush_interval = 1.0
 
-        try:
-            packet.data = unpack(
-                '{0}s'.format(int(packet.length)),
-                raw_data[18:18 + int(packet.length)])[0]
-        except Exception:
-            return None
+CAPTURE_RECORD_FRAME = 0
+CAPTURE_RECORD_SESSION = 1
 
-        return packet
+# capture file all accepted frames get written to, set with --capture
+dmx_capture = None
 
+# seconds between checks if the config file changed if started with --watch-config
+config_watch_interval = 1.0
+# options which are only applied on start, changing them requires a restart
+config_restart_options = ["art-net.enabled", "art-net.listen_address", "art-net.receive_buffer_size",
+                          "ola-dmx.enabled", "sacn.enabled", "sacn.listen_address", "sacn.receive_buffer_size",
+                          "metrics.enabled", "metrics.listen_address", "metrics.port", "metrics.log_interval"]
+# reloaded config, gets applied by the receiving thread before handling the next packet
+pending_config = None
+# set to trigger a reload of the config file
+config_reload_event = threading.Event()
+# the sACN socket, multicast groups of universes added by a config reload get joined on it
+sacn_socket = None
+# format version of the compiled config cache, needs to change if the parsed config changes
+config_cache_format = 1
+# parsed config items which are compiled after loading and never stored in the config cache
+config_compiled_items = ["osc.destinations", "osc.universes"]
 
-def parse_command_line():
-    """parse command line arguments
-    Also add current version and version date to description
-    """
+# max number of datagrams read with one receive call
+receive_batch_size = 64
+# max size of a received datagram, Art-Net and sACN DMX packets are smaller
+receive_datagram_size = 1024
+# max number of datagrams read before the latest frames get handled
+receive_drain_limit = 1024
+# size of the socket receive buffer in bytes, 0 keeps the system default
+default_receive_buffer_size = 0
 
-    # define command line options
-    parser = argparse.ArgumentParser(
-        description=__description__ + "\nVersion: " + __version__ + " (" + __version_date__ + ")",
-        formatter_class=argparse.RawDescriptionHelpFormatter)
+# OSC command type codes used in compiled channel dispatch records
+OSC_TYPE_VALUE = 0
+OSC_TYPE_TRIGGER = 1
+OSC_TYPE_TOGGLE = 2
+OSC_TYPE_RANGE = 3
 
-    parser.add_argument("-c", "--config", default=default_config_file_path, dest="config_file",
-                        help="points to the config file to read config data from " +
-                             "which is not installed under the default path '" +
-                             default_config_file_path + "'",
-                        metavar="dmx_to_osc.ini")
-    parser.add_argument("-v", "--verbose", action='store_true',
-                        help="be verbose and print debug information")
-    parser.add_argument("--profile", action='store_true',
-                        help="display current FPS of DMX frames")
+osc_type_codes = {
+    "value": OSC_TYPE_VALUE,
+    "trigger": OSC_TYPE_TRIGGER,
+    "toggle": OSC_TYPE_TOGGLE,
+    "range": OSC_TYPE_RANGE
+}
 
-    return parser.parse_args()
+osc_output_modes = ["message", "bundle"]
 
+# value tables of the command type 'range' by start and end of the range
+osc_range_value_tables = dict()
 
-def parse_config_inputs_section(handler, section):
-    this_config_dict = dict()
+# optional key=value options at the end of a channel definition
+osc_channel_options = ["deadband", "priority"]
 
-    config_items = ["enabled", "universe"]
+# priority classes of channels, messages of high priority channels are sent ahead of
+# all other messages of a destination and are not held back by max_rate
+osc_channel_priorities = ["normal", "high"]
+# command types which have high priority unless the channel sets its own priority
+osc_high_priority_types = [OSC_TYPE_TRIGGER, OSC_TYPE_TOGGLE]
 
-    if section == "art-net":
-        config_items.append("listen_address")
+# errors of a non-blocking send if the socket send buffer is full, remaining messages are deferred
+osc_send_buffer_full_errors = [errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS]
 
-    if section not in handler.sections():
-        logging.warning("Section '%s' not found in config file" % section)
-        this_config_dict["%s.universe" % section] = default_dmx_universe
-        this_config_dict["%s.enabled" % section] = "0"
-    else:
-        for item in config_items:
-            config_dict_name = "%s.%s" % (section, item)
-            if item in list(dict(handler.items(section))):
-                this_config_dict[config_dict_name] = handler.get(section, item).strip()
-                logging.debug("Config: %s = %s" % (config_dict_name, this_config_dict[config_dict_name]))
+# bundle header with time tag (0, 1) which means "immediately", shared by all bundles of a frame
+osc_bundle_header = b"#bundle\x00" + pack(">II", 0, 1)
+# bundles need at least space for the header and one element
+osc_bundle_min_size = 64
+# int32 argument of an OSC message, the only part of a message which changes per value
+osc_int_struct = Struct(">i")
+# LRU cache of encoded OSC messages, enabled with --osc-cache-size
+osc_datagram_cache = None
 
-            if item == "universe" and (this_config_dict.get(config_dict_name) is None
-                                       or len(this_config_dict.get(config_dict_name)) == 0):
-                this_config_dict[config_dict_name] = default_dmx_universe
-                logging.debug("Config: option %s not set. Using default value: %s" %
-                              (config_dict_name, str(default_dmx_universe)))
+# seconds between re-resolving the addresses of OSC destinations
+osc_destination_resolve_interval = 300
+# seconds between connection attempts of OSC destinations which are not connected
+osc_destination_reconnect_interval = 5
+# consecutive send errors after which a destination gets paused
+osc_destination_max_errors = 3
+# seconds without send error after which a destination is considered healthy again
+osc_destination_recovery_time = 2.0
+# min and max seconds a failing destination gets paused, doubles with every further error
+osc_destination_backoff_min = 1.0
+osc_destination_backoff_max = 60.0
+# min seconds between retries of queued OSC messages, i.e. while the send buffer is full
+osc_send_retry_interval = 0.001
+# seconds between checks for queued OSC messages with the OLA client if no destination is rate limited
+ola_flush_check_interval = 1.0
 
-            if item == "enabled" and (this_config_dict.get(config_dict_name) is None
-                                      or len(this_config_dict.get(config_dict_name)) == 0):
-                this_config_dict[config_dict_name] = "1"
 
-    return this_config_dict
+class IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
 
 
-def parse_own_config(config_file):
-    """parsing and basic validation of own config file
+class MsgHdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p), ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.c_void_p), ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p), ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def load_libc_function(name):
+    """
+    return a function of the C library or None if the platform doesn't provide it
+    """
+
+    # symbols of the running process include the C library, ctypes.util.find_library()
+    # would spawn a subprocess on every call which noticeably delays the start
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        return getattr(libc, name)
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+# sendmmsg is used to send all datagrams of a frame with one syscall (Linux only)
+libc_sendmmsg = load_libc_function("sendmmsg")
+# recvmmsg is used to drain the input sockets with few syscalls (Linux only)
+libc_recvmmsg = load_libc_function("recvmmsg")
+# flag of recvmmsg to return instead of waiting for datagrams (Linux)
+MSG_DONTWAIT = 0x40
+
+
+class SockAddrIn(ctypes.Structure):
+    _fields_ = [("sin_family", ctypes.c_ushort), ("sin_port", ctypes.c_ubyte * 2),
+                ("sin_addr", ctypes.c_ubyte * 4), ("sin_zero", ctypes.c_ubyte * 8)]
+
+
+class ConfigError(Exception):
+    """
+    raised if the config file can't be read or contains invalid options
+    """
+
+
+class DmxFrame(object):
+    """
+    DMX data of a universe received from any of the inputs
+
     Parameters
     ----------
-    config_file : str
-        The file location of the config file
-    Returns
-    -------
-    dict
-        a dictionary with all config options parsed from the config file
+    universe : int
+        the DMX universe the data belongs to
+    data : memoryview, bytes, bytearray, array.array or list
+        DMX data of up to 512 channels, decoded packets reference the received datagram without copying it
+    sequence : int
+        sequence number of the packet, 0 if not used
+    priority : int
+        sACN priority of the source
+    options : int
+        sACN framing options
+    source : bytes
+        sACN CID of the source
     """
 
-    config_dict = dict()
+    __slots__ = ("universe", "data", "sequence", "priority", "options", "source")
 
-    config_problem = False
+    def __init__(self, universe, data, sequence=0, priority=0, options=0, source=None):
+        self.universe = universe
+        self.data = data
+        self.sequence = sequence
+        self.priority = priority
+        self.options = options
+        self.source = source
 
-    logging.debug("Parsing config file: %s" % config_file)
+    def __repr__(self):
+        return "DmxFrame(universe=%d, sequence=%d, priority=%d, options=0x%02x, length=%d)" % (
+            self.universe, self.sequence, self.priority, self.options, len(self.data))
 
-    if config_file is None or config_file == "":
-        do_error_exit("Config file not defined.")
 
-    # setup config parser and read config
-    config_handler = configparser.SafeConfigParser()
+class ArtnetPacket:
+    ARTNET_HEADER = b'Art-Net\x00'
 
-    try:
-        config_handler.read(config_file)
-    except configparser.Error as e:
-        do_error_exit("Error during config file parsing: %s" % e)
-    except Exception as e:
-        do_error_exit("Unable to open file '%s': %s" % (config_file, str(e)))
+    @staticmethod
+    def unpack_raw_artnet_packet(raw_data):
+        """
+        decode an ArtDmx packet, all other packets are counted as dropped
 
-    config_dict.update(parse_config_inputs_section(config_handler, "art-net"))
-    config_dict.update(parse_config_inputs_section(config_handler, "ola-dmx"))
+        Parameters
+        ----------
+        raw_data : memoryview
+            the received datagram
 
-    if config_dict["art-net.enabled"] == "1" and \
-            (config_dict.get("art-net.listen_address") is None or
-             len(config_dict["art-net.listen_address"]) == 0):
-        config_problem = True
-        logging.error("art-net option 'listen_address' not configured.")
+        Returns
+        -------
+        DmxFrame
+            the DMX data of the packet or None if it isn't a valid ArtDmx packet
+        """
 
-    # initialize empty mapping array
-    mapping = dict.fromkeys(range(dmx_num_channels), None)
+        if len(raw_data) < artnet_dmx_header_struct.size:
+            metrics.drop_packet("non_artnet")
+            return None
 
-    channel_prefix = "channel"
+        (header, op_code, version, sequence, _,
+         subuni, net, length) = artnet_dmx_header_struct.unpack_from(raw_data)
 
-    # get osc sections
-    for config_section in config_handler.sections():
+        if header != ArtnetPacket.ARTNET_HEADER:
+            metrics.drop_packet("non_artnet")
+            return None
 
-        if config_section not in ["ola-dmx", "art-net"] and not config_section.startswith("osc/"):
-            logging.warning("ignoring invalid section '%s' in config file." % config_section)
-            continue
+        # reject ArtPoll and all other packets before looking at the payload
+        if op_code != ArtDmxPackage or version < 14:
+            metrics.drop_packet("not_artdmx")
+            return None
 
-        if config_section.startswith("osc/"):
-            osc_destination = dict()
-            osc_destination["name"] = config_section.split("/")[1]
+        data_end = artnet_dmx_header_struct.size + length
+        if len(raw_data) < data_end:
+            metrics.drop_packet("malformed")
+            return None
 
-            section_config_options = list(dict(config_handler.items(config_section)))
+        # 15 bit port address, for net 0 identical to subuni
+        return DmxFrame(net << 8 | subuni, raw_data[artnet_dmx_header_struct.size:data_end], sequence)
 
-            if "enabled" in section_config_options:
-                if config_handler.get(config_section, "enabled").strip() == "0":
-                    logging.info("config section '%s' is disabled and will be skipped" % config_section)
-                    continue
 
-            config_option_name = "server"
-            if config_option_name in section_config_options:
-                osc_destination[config_option_name] = config_handler.get(config_section, config_option_name).strip()
-                if len(osc_destination[config_option_name]) == 0:
-                    config_problem = True
-                    logging.error("option '%s' empty for OSC destination '%s'"
-                                  % (config_option_name, osc_destination["name"]))
-                logging.debug("Config: %s = %s" %
-                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
-            else:
-                config_problem = True
-                logging.error("Option '%s' missing in config section '%s'" % (config_option_name, config_section))
+class SacnPacket:
+    SACN_HEADER = b'\x00\x10\x00\x00ASC-E1.17\x00\x00\x00'
 
-            config_option_name = "port"
-            if config_option_name in section_config_options:
-                osc_destination[config_option_name] = config_handler.get(config_section, config_option_name).strip()
-                if len(osc_destination[config_option_name]) == 0:
-                    config_problem = True
-                    logging.error("option '%s' empty for OSC destination '%s'"
-                                  % (config_option_name, osc_destination["name"]))
-                logging.debug("Config: %s = %s" %
-                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
-            else:
-                config_problem = True
-                logging.error("Option '%s' missing in config section '%s'" % (config_option_name, config_section))
+    @staticmethod
+    def unpack_raw_sacn_packet(raw_data):
+        """
+        decode a sACN DMX data packet, all other packets are counted as dropped
 
-            # store port as int to save type casting on every message sent
-            osc_destination[config_option_name] = int(osc_destination[config_option_name])
+        Parameters
+        ----------
+        raw_data : memoryview
+            the received datagram
 
-            for key, channel_osc_command in dict(config_handler.items(config_section)).items():
+        Returns
+        -------
+        DmxFrame
+            the DMX data of the packet or None if it isn't a valid sACN data packet with start code 0
+        """
 
-                channel_osc_command = channel_osc_command.strip()
+        if len(raw_data) < 126:
+            metrics.drop_packet("non_sacn")
+            return None
 
-                # skip expected config options
-                if key in ["server", "port", "enabled"]:
-                    continue
+        header, root_vector, cid, framing_vector = sacn_layers_struct.unpack_from(raw_data)
 
-                if key.split("_")[0] != channel_prefix:
-                    config_problem = True
-                    logging.warning("config item '%s' starts with wrong prefix, expected: '%s'" % (key, channel_prefix))
-                    continue
+        if header != SacnPacket.SACN_HEADER:
+            metrics.drop_packet("non_sacn")
+            return None
 
-                try:
-                    channel_name = int(key.split("_")[1])
-                except ValueError:
-                    config_problem = True
-                    logging.warning(
-                        "config item '%s' channel must be int but '%s' given" % (key, str(key.split("_")[1])))
-                    continue
+        # only accept DMX data packets, no universe discovery or sync packets
+        if root_vector != VECTOR_ROOT_E131_DATA or framing_vector != VECTOR_E131_DATA_PACKET:
+            metrics.drop_packet("not_dmx")
+            return None
 
-                # i.e. channel 1 is represented with id 0 in DMX data and so on
-                channel_id = channel_name - 1
+        priority, sequence, options, universe = sacn_framing_struct.unpack_from(raw_data, 108)
+        property_value_count, start_code = sacn_dmp_struct.unpack_from(raw_data, 123)
 
-                if channel_name == 0:
-                    config_problem = True
-                    logging.warning("channels in section '%s' need to start with 1" % config_section)
-                    continue
+        # alternate start codes and preview data are not meant for live output
+        if start_code != 0 or options & SACN_OPTION_PREVIEW_DATA:
+            metrics.drop_packet("not_dmx")
+            return None
 
-                if channel_name > dmx_num_channels:
-                    config_problem = True
-                    logging.warning("config item '%s' exceeds the maximum number of valid DMX channels: %d" %
-                                    (key, dmx_num_channels))
-                    continue
+        # first property value is the start code
+        data_end = 125 + property_value_count
+        if property_value_count < 1 or len(raw_data) < data_end:
+            metrics.drop_packet("malformed")
+            return None
 
-                # check command and type
-                command_and_type = channel_osc_command.split(":")
+        return DmxFrame(universe, raw_data[126:data_end], sequence, priority, options, cid)
 
-                if len(command_and_type) == 1:
-                    config_problem = True
-                    logging.warning("missing OSC command type for command '%s' for channel '%s'"
-                                    % (command_and_type[0], channel_name))
-                    continue
 
-                command_type = command_and_type[1]
-                if command_type not in ["value", "trigger", "toggle", "range"]:
-                    config_problem = True
-                    logging.warning("invalid OSC command type '%s' for command '%s' for channel '%s'"
-                                    % (command_and_type[0], command_and_type[0], channel_name))
-                    continue
+class Histogram(object):
+    """
+    histogram with fixed buckets, observing a value is a single bisect and two additions
+    """
 
-                if command_type == "range":
-                    if len(command_and_type) != 4:
-                        config_problem = True
-                        logging.warning(
-                            "wrong format '%s' for OSC command type 'range' for command '%s' for channel '%s'"
-                            % (channel_osc_command, command_and_type[0], channel_name))
-                        continue
-                    try:
-                        int(command_and_type[2])
-                        int(command_and_type[3])
-                    except ValueError:
-                        config_problem = True
-                        logging.warning(
-                            "command type 'range' start and end for channel '%s' must be int, got '%s:%s'" %
-                            (channel_name, str(command_and_type[2]), str(command_and_type[3])))
-                        continue
+    __slots__ = ("bounds", "counts", "sum", "count")
 
-                # add command to mapping
-                if mapping.get(channel_id) is None:
-                    channel_destinations = [osc_destination]
-                else:
-                    if mapping.get(channel_id).get("command") != channel_osc_command:
-                        config_problem = True
-                        logging.error("channel definition mismatch between '%s' and '%s' for channel '%s'" %
-                                      (mapping.get(channel_id).get("destinations")[0].get("name"),
-                                       osc_destination.get("name"), channel_name))
+    def __init__(self, bounds):
 
-                    channel_destinations = mapping.get(channel_id).get("destinations")
-                    channel_destinations.append(osc_destination)
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0
+        self.count = 0
 
-                mapping[channel_id] = {"command": channel_osc_command, "destinations": channel_destinations}
+    def observe(self, value):
 
-    if config_problem is True:
-        do_error_exit("found config problems during parsing. Exit")
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
 
-    for key, val in mapping.items():
+    def quantile(self, share):
+        """
+        return the upper bound of the bucket the quantile falls into, None if nothing was observed
+        """
 
-        if val is not None:
-            logging.debug("Config: channel %d, command: %s, destinations: %s"
-                          % (key + 1, val.get("command"), str([d['name'] for d in val.get("destinations")])))
+        if self.count == 0:
+            return None
 
-    config_dict["osc"] = mapping
+        rank = share * self.count
+        cumulative_count = 0
+        for index, count in enumerate(self.counts):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
 
-    return config_dict
+    def format_prometheus(self, name, labels=""):
+        """
+        return histogram in Prometheus text format
+        """
 
+        lines = list()
+        label_prefix = labels + "," if len(labels) > 0 else ""
+        cumulative_count = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative_count += count
+            lines.append('%s_bucket{%sle="%s"} %d' % (name, label_prefix, repr(float(bound)), cumulative_count))
+        lines.append('%s_bucket{%sle="+Inf"} %d' % (name, label_prefix, self.count))
 
-def do_error_exit(log_text):
-    """log an error and exit with return code 1
-    Parameters
-    ----------
-    log_text : str
-        the text to log as error
-    """
+        label_string = "{%s}" % labels if len(labels) > 0 else ""
+        lines.append("%s_sum%s %s" % (name, label_string, repr(float(self.sum))))
+        lines.append("%s_count%s %d" % (name, label_string, self.count))
 
-    logging.error(log_text)
-    exit(1)
+        return lines
 
 
-def send_dmx_to_osc(data):
+class Metrics(object):
     """
-    send DMX data array to OSC receiver
+    counters and histograms of the DMX input and frame processing
 
-    Parameters
-    ----------
-    data : list
-        data array with a length of 512 items
+    Counters of the OSC destinations are kept in the OscDestination objects.
     """
 
-    global last_dmx_block, last_run_ts
+    def __init__(self):
+
+        self.start_ts = time.time()
+        self.packets_received = 0
+        self.packets_dropped = dict.fromkeys(packet_drop_reasons, 0)
+        # frames replaced by a newer frame of the same universe before they got handled
+        self.frames_superseded = 0
+        self.packets_per_receive = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024])
+        self.frame_processing_time = Histogram([0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                                                0.025, 0.05, 0.1])
+        self.channels_changed = Histogram([0, 1, 2, 5, 10, 20, 50, 100, 200, 512])
+        self.frame_interval = Histogram([0.005, 0.01, 0.02, 0.025, 0.03, 0.05, 0.1, 0.25, 0.5, 1])
+        self.frame_jitter = Histogram([0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1])
+        # time OSC messages wait at their destination until they get sent, per channel priority
+        self.osc_send_latency = dict((priority, Histogram([0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                                                           0.025, 0.05, 0.1, 0.25]))
+                                     for priority in osc_channel_priorities)
+        # packets received, frames, messages sent and send errors at the time of the last summary
+        self._last_summary = (0, 0, 0, 0)
+        # frame processing and OSC destination metrics, collected by the workers if OSC workers are used
+        self.output_enabled = True
 
-    if args.profile is True and last_run_ts is not None:
-        print("FPS: %0.2f" % (1.0 / (time.time() - last_run_ts)))
+    def drop_packet(self, reason):
 
-    last_run_ts = time.time()
+        self.packets_dropped[reason] += 1
 
-    # truncate DMX packet if it contains more then 512 values
-    data = data[:(dmx_num_channels - 1)]
-    # pad DMX packet if it is truncated
-    data.extend([0] * (dmx_num_channels - len(data)))
+    def supersede_frame(self):
 
-    for dmx_channel_id, value in enumerate(data):
+        self.frames_superseded += 1
 
-        # if value for channel is different from last blocks value then send an OSC message
-        if value != last_dmx_block[dmx_channel_id]:
+    def format_prometheus(self, destinations):
+        """
+        return all metrics in Prometheus text format
 
-            osc_command_data = config["osc"][dmx_channel_id]
-            dmx_channel_num = dmx_channel_id + 1
+        Parameters
+        ----------
+        destinations : dict
+            OSC destination name to OscDestination mapping
 
-            if osc_command_data is None:
-                logging.error("Received value '%d' for undefined DMX channel '%d'" % (value, dmx_channel_num))
-                continue
+        Returns
+        -------
+        str
+            metrics in Prometheus text format
+        """
 
-            osc_command_destinations = osc_command_data.get("destinations")
+        lines = list()
 
-            if osc_command_destinations is None:
-                logging.warning("missing destinations for '%s' on channel '%d'" % (osc_command, dmx_channel_num))
-                continue
+        def add_metric(name, metric_type, description, values):
+            lines.append("# HELP %s %s" % (name, description))
+            lines.append("# TYPE %s %s" % (name, metric_type))
+            if metric_type == "histogram":
+                for labels, histogram in values:
+                    lines.extend(histogram.format_prometheus(name, labels))
+            else:
+                for labels, value in values:
+                    lines.append("%s%s %s" % (name, "{%s}" % labels if len(labels) > 0 else "", value))
 
-            # check command and type
-            osc_command_and_type = osc_command_data.get("command").split(":")
-            osc_command_name = osc_command_and_type[0]
-            osc_command_type = osc_command_and_type[1]
+        add_metric("dmx_to_osc_uptime_seconds", "gauge", "Seconds since start",
+                   [("", "%0.3f" % (time.time() - self.start_ts))])
+        add_metric("dmx_to_osc_packets_received_total", "counter", "Received input packets",
+                   [("", self.packets_received)])
+        add_metric("dmx_to_osc_packets_dropped_total", "counter", "Dropped input packets by reason",
+                   [('reason="%s"' % reason, self.packets_dropped[reason]) for reason in packet_drop_reasons])
+        add_metric("dmx_to_osc_frames_superseded_total", "counter",
+                   "Frames replaced by a newer frame of the same universe before they got handled",
+                   [("", self.frames_superseded)])
+        add_metric("dmx_to_osc_packets_per_receive", "histogram",
+                   "Packets read from the input sockets at once, high values mean a backlog got drained",
+                   [("", self.packets_per_receive)])
 
-            value_to_send = value
+        if self.output_enabled is False:
+            return "\n".join(lines) + "\n"
 
-            if value > 255:
-                logging.warning("submitted DMX value for channel '%s' out of range: %d " % (dmx_channel_num, value))
-                value_to_send = 255
+        add_metric("dmx_to_osc_frame_processing_seconds", "histogram", "Processing time of DMX frames",
+                   [("", self.frame_processing_time)])
+        add_metric("dmx_to_osc_frame_channels_changed", "histogram", "Changed channels per DMX frame",
+                   [("", self.channels_changed)])
+        add_metric("dmx_to_osc_frame_interval_seconds", "histogram", "Inter-arrival time of DMX frames",
+                   [("", self.frame_interval)])
+        add_metric("dmx_to_osc_frame_jitter_seconds", "histogram",
+                   "Difference between consecutive inter-arrival times of DMX frames",
+                   [("", self.frame_jitter)])
+        add_metric("dmx_to_osc_osc_send_latency_seconds", "histogram",
+                   "Time from queuing to sending OSC messages by channel priority",
+                   [('priority="%s"' % priority, self.osc_send_latency[priority])
+                    for priority in osc_channel_priorities])
 
-            if value < 0:
-                logging.warning("submitted DMX value for channel '%s' out of range: %d " % (dmx_channel_num, value))
-                value_to_send = 0
+        destination_labels = [('destination="%s"' % name, destination)
+                              for name, destination in sorted(destinations.items())]
 
-            command_translated = None
+        add_metric("dmx_to_osc_osc_messages_sent_total", "counter", "OSC messages sent per destination",
+                   [(labels, d.messages_sent) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_datagrams_sent_total", "counter", "UDP datagrams sent per destination",
+                   [(labels, d.datagrams_sent) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_send_errors_total", "counter", "Send errors per destination",
+                   [(labels, d.send_errors) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_updates_coalesced_total", "counter",
+                   "Queued updates replaced by a newer value of the same channel",
+                   [(labels, d.coalesced_count) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_messages_deferred_total", "counter",
+                   "Normal priority OSC messages deferred because the socket send buffer was full",
+                   [(labels, d.messages_deferred) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_messages_suppressed_total", "counter",
+                   "OSC messages skipped because the destination already had the value",
+                   [(labels, d.suppressed_count) for labels, d in destination_labels])
+        add_metric("dmx_to_osc_osc_destination_healthy", "gauge", "1 if the last send to the destination succeeded",
+                   [(labels, 1 if d.is_healthy() else 0) for labels, d in destination_labels])
 
-            # calculate value to send according range span
-            if osc_command_type == "range":
-                dmx_span = 256
-                range_min = int(osc_command_and_type[2])
-                range_max = int(osc_command_and_type[3])
-                range_span = range_max - range_min + 1
+        return "\n".join(lines) + "\n"
 
-                value_to_send = int(range_min + (float(float(range_span) / float(dmx_span)) * float(value_to_send)))
+    def format_summary(self, destinations, interval):
+        """
+        return a one line summary of the metrics since the last summary
 
-            elif osc_command_type == "toggle":
-                command_translated = "Off" if value_to_send == 0 else "On"
-            elif osc_command_type == "trigger":
-                command_translated = "None" if value_to_send == 0 else "Triggered"
-            elif osc_command_type == "value":
-                pass
-            else:
-                logging.warning("invalid OSC command type: %s" % osc_command_type)
-                continue
+        Parameters
+        ----------
+        destinations : dict
+            OSC destination name to OscDestination mapping
+        interval : float
+            seconds since the last summary
 
-            # take care of bool types
-            if osc_command_type in ["trigger", "toggle"]:
-                if value > 1:
-                    value_to_send = 1
+        Returns
+        -------
+        str
+            summary log line
+        """
 
-            # assemble log text
-            log_text = "%s => %d" % (osc_command_name, value_to_send)
-            if command_translated is not None:
-                log_text += " (%s)" % command_translated
-            log_text += " (type: %s) (DMX input: %d on %d)" % (osc_command_type, value, dmx_channel_num)
+        if self.output_enabled is False:
+            last = self._last_summary
+            self._last_summary = (self.packets_received, 0, 0, 0)
 
-            # send osc message to all destinations
-            for destination in osc_command_destinations:
-                logging.debug("Sending OSC command: %s to %s" % (log_text, destination.get("name")))
+            return "metrics: %0.1f packets/s, dropped packets total: %s, superseded frames total: %d" % (
+                (self.packets_received - last[0]) / interval,
+                ", ".join(["%s: %d" % (reason, self.packets_dropped[reason]) for reason in packet_drop_reasons
+                           if self.packets_dropped[reason] > 0]) or "0",
+                self.frames_superseded)
 
-                try:
-                    send_osc_message(b'%s' % osc_command_name.encode(),
-                                     [value_to_send], destination.get("server"), destination.get("port"))
-                except Exception as e:
-                    logging.warning("Sending command to '%s' failed: %s" % (destination.get("name"), str(e)))
+        frames = self.frame_processing_time.count
+        messages_sent = sum([d.messages_sent for d in destinations.values()])
+        send_errors = sum([d.send_errors for d in destinations.values()])
 
-    last_dmx_block = data
+        last = self._last_summary
+        self._last_summary = (self.packets_received, frames, messages_sent, send_errors)
 
-    return
+        processing_p50 = self.frame_processing_time.quantile(0.5)
+        processing_p99 = self.frame_processing_time.quantile(0.99)
+        high_priority_p99 = self.osc_send_latency["high"].quantile(0.99)
 
+        return ("metrics: %0.1f packets/s, %0.1f frames/s, %0.1f OSC msgs/s, %d send errors, "
+                "dropped packets total: %s, superseded frames total: %d, "
+                "frame processing p50 <= %s ms, p99 <= %s ms, avg channels changed: %0.1f, "
+                "high priority send latency p99 <= %s ms" % (
+                    (self.packets_received - last[0]) / interval,
+                    (frames - last[1]) / interval,
+                    (messages_sent - last[2]) / interval,
+                    send_errors - last[3],
+                    ", ".join(["%s: %d" % (reason, self.packets_dropped[reason]) for reason in packet_drop_reasons
+                               if self.packets_dropped[reason] > 0]) or "0",
+                    self.frames_superseded,
+                    "n/a" if processing_p50 is None else "%0.2f" % (processing_p50 * 1000),
+                    "n/a" if processing_p99 is None else "%0.2f" % (processing_p99 * 1000),
+                    float(self.channels_changed.sum) / frames if frames > 0 else 0,
+                    "n/a" if high_priority_p99 is None else "%0.2f" % (high_priority_p99 * 1000)))
 
-def start_artnet_listener():
+
+metrics = Metrics()
+
+
+class StartupTiming(object):
     """
-        listen for Art-Net packages and send to OSC destination
+    time of the startup phases relative to the start of the script, enabled with --startup-timing
+
+    The report gets logged once the first OSC message got sent.
     """
-    logging.info("Art-Net server listening on {0}:{1}".format(
-        config["art-net.listen_address"], artnet_udp_port))
 
-    sock = socket(AF_INET, SOCK_DGRAM)  # UDP
-    sock.bind((config["art-net.listen_address"], artnet_udp_port))
+    def __init__(self, start_ts):
+        self.start_ts = start_ts
+        self.phases = list()
 
-    # sock_broadcast = socket(AF_INET, SOCK_DGRAM)
-    # sock_broadcast.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
-    # sock_broadcast.setsockopt(SOL_SOCKET, SO_BROADCAST, 1)
+    def mark(self, phase, detail=None):
+        """
+        record the end of a startup phase, only the first occurrence of a phase is kept
+        """
 
-    last_sequence = 0
-    package_source_ip = None
-    listening_universe = int(config["art-net.universe"])
+        if phase in [p for p, _, _ in self.phases]:
+            return
 
-    while True:
-        try:
-            data, address = sock.recvfrom(1024)
+        self.phases.append((phase, time.time(), detail))
 
-            if package_source_ip is None:
-                logging.debug("accepting packages from: %s", address[0])
-                package_source_ip = address[0]
-            elif address[0] != package_source_ip:
-                continue
+    def format_report(self):
+        """
+        return the startup report as a single log line
+        """
 
-            packet = ArtnetPacket.unpack_raw_artnet_packet(data)
+        report = list()
+        last_ts = self.start_ts
 
-            # only accept "ArtDmx" packages
-            if packet is None or \
-                    packet.op_code != ArtDmxPackage or \
-                    packet.ver < 14:
-                continue
+        for phase, phase_ts, detail in self.phases:
+            report.append("%s: %0.1f ms (+%0.1f ms%s)" % (phase, (phase_ts - self.start_ts) * 1000,
+                                                          (phase_ts - last_ts) * 1000,
+                                                          "" if detail is None else ", %s" % detail))
+            last_ts = phase_ts
 
-            if packet.sequence != last_sequence:
-                last_sequence = packet.sequence
-            else:
-                continue
+        return "Startup timing: %s" % ", ".join(report)
 
-            # check package for the correct universe
-            if packet.subuni != listening_universe:
-                continue
 
-            # convert byte data to list of ints
-            # works for python2 and python3
-            data_array = array.array("B")
-            data_array.fromstring(packet.data)
-            send_dmx_to_osc(list(data_array))
+# startup phases, set with --startup-timing and reset after the first OSC message got sent
+startup_timing = None
 
-        except KeyboardInterrupt:
-            sock.close()
-            # sock_broadcast.close()
-            exit(0)
 
+class ArtnetSource(object):
+    """
+    state of a single Art-Net sender of a universe
+    """
 
-if __name__ == "__main__":
+    __slots__ = ("address", "last_sequence", "last_seen_ts", "frame")
 
-    # parse command line
-    args = parse_command_line()
+    def __init__(self, address, now):
 
-    # set log level
-    if args.verbose:
-        log_level = "DEBUG"
-    else:
-        log_level = "INFO"
+        self.address = address
+        self.last_sequence = 0
+        self.last_seen_ts = now
+        # last frame of this sender, only used if senders get merged
+        self.frame = None
 
-    logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s: %(message)s')
+    def check_sequence(self, sequence):
+        """
+        check the sequence number of a packet of this sender
 
-    # parse config data
-    config = parse_own_config(args.config_file)
+        Sequence number 0 disables the check. Numbers wrap around after 255, a packet is
+        newer if its sequence is up to artnet_sequence_window ahead of the previous one.
 
-    if config["ola-dmx.enabled"] == "1" and ola_module_present is False:
-        logging.warning("OLA python libs not found.")
-        config["ola-dmx.enabled"] = "0"
+        Parameters
+        ----------
+        sequence : int
+            sequence number of the received packet
 
-    # register and run ola DMX client
-    if config["ola-dmx.enabled"] == "1":
-        logging.info("Starting DMX to OSC with OLA client")
+        Returns
+        -------
+        str
+            None if the packet is newer, otherwise the reason to drop it
+        """
+
+        if sequence == 0 or self.last_sequence == 0:
+            self.last_sequence = sequence
+            return None
+
+        distance = (sequence - self.last_sequence) % 256
+
+        if distance == 0:
+            return "duplicate_sequence"
+
+        if distance > artnet_sequence_window:
+            return "stale_sequence"
+
+        self.last_sequence = sequence
+
+        return None
+
+
+class SacnSource(object):
+    """
+    state of a single sACN source of a universe
+    """
+
+    __slots__ = ("cid", "address", "priority", "last_sequence", "last_seen_ts")
+
+    def __init__(self, cid, address, now):
+
+        self.cid = cid
+        # IP address of the sender, only used for logging
+        self.address = address
+        self.priority = 0
+        self.last_sequence = None
+        self.last_seen_ts = now
+
+    def check_sequence(self, sequence):
+        """
+        check the sequence number of a packet of this source
+
+        Packets with a sequence number up to sacn_sequence_reject_window behind the
+        previous one are out of order (E1.31 6.7.2).
+
+        Parameters
+        ----------
+        sequence : int
+            sequence number of the received packet
+
+        Returns
+        -------
+        str
+            None if the packet is newer, otherwise the reason to drop it
+        """
+
+        if self.last_sequence is not None:
+            distance = (sequence - self.last_sequence) % 256
+
+            if distance == 0:
+                return "duplicate_sequence"
+
+            if distance > 256 - sacn_sequence_reject_window:
+                return "stale_sequence"
+
+        self.last_sequence = sequence
+
+        return None
+
+
+class DmxUniverse(object):
+    """
+    state of a single DMX universe
+
+    Holds the dispatch table of the universe, the OSC destinations used by it,
+    the Art-Net senders and sACN sources of this universe and the last DMX frame
+    received for this universe.
+    """
+
+    __slots__ = ("universe", "dispatch_table", "destinations", "high_priority_channels", "last_dmx_block",
+                 "sources", "merged_frame", "sacn_sources", "sacn_active_source", "last_frame_ts",
+                 "last_frame_interval")
+
+    def __init__(self, universe, dispatch_table):
+
+        self.universe = universe
+        self.dispatch_table = dispatch_table
+        self.last_dmx_block = bytearray(dmx_num_channels)
+        self.sources = dict()
+        self.merged_frame = bytearray(dmx_num_channels)
+        self.sacn_sources = dict()
+        self.sacn_active_source = None
+        self.last_frame_ts = None
+        self.last_frame_interval = None
+
+        destinations = list()
+        for osc_command in dispatch_table:
+            if osc_command is None:
+                continue
+            for destination in osc_command.destinations:
+                if destination not in destinations:
+                    destinations.append(destination)
+
+        self.destinations = tuple(destinations)
+
+        # ids of channels which get translated ahead of all other channels of a frame
+        self.high_priority_channels = frozenset([channel_id for channel_id, osc_command in enumerate(dispatch_table)
+                                                 if osc_command is not None and osc_command.high_priority is True])
+
+    def take_over_state(self, dmx_universe):
+        """
+        continue with the input state and the last frame of the same universe of the previous config
+        """
+
+        self.last_dmx_block = dmx_universe.last_dmx_block
+        self.sources = dmx_universe.sources
+        self.merged_frame = dmx_universe.merged_frame
+        self.sacn_sources = dmx_universe.sacn_sources
+        self.sacn_active_source = dmx_universe.sacn_active_source
+        self.last_frame_ts = dmx_universe.last_frame_ts
+        self.last_frame_interval = dmx_universe.last_frame_interval
+
+
+class OscDispatchRecord(object):
+    """
+    precompiled OSC mapping of a single DMX channel
+
+    All string parsing and value translation of a channel command is done once
+    while compiling the config. Translating a DMX value on the hot path is just
+    an index into value_table.
+
+    A channel group maps several consecutive channels to a single OSC message with
+    one argument per channel, the same record is used for all channels of the group.
+    The value of a group is a tuple with the translated values of all its channels.
+    """
+
+    __slots__ = ("channel_num", "channel_ids", "is_group", "command", "name", "address", "datagram_prefix",
+                 "value_struct", "pack_value", "type_name", "type_code", "value_table", "deadband", "high_priority",
+                 "destinations")
+
+    def __init__(self, channel_num, command, destinations, channel_ids=None):
+
+        command_and_type, channel_options = split_channel_options(command)
+
+        self.channel_num = channel_num
+        self.channel_ids = (channel_num - 1,) if channel_ids is None else tuple(channel_ids)
+        self.is_group = len(self.channel_ids) > 1
+        self.command = command
+        self.name = command_and_type[0]
+        self.address = self.name.encode()
+
+        # encoded message without the int arguments: padded address and type tags
+        self.value_struct = Struct(">%di" % len(self.channel_ids))
+        encoded_message = format_osc_message(self.address, [0] * len(self.channel_ids))[0]
+        self.datagram_prefix = encoded_message[:-self.value_struct.size]
+        self.pack_value = self.pack_group_value if self.is_group is True else osc_int_struct.pack
+
+        self.type_name = command_and_type[1]
+        self.type_code = osc_type_codes[self.type_name]
+
+        if self.type_code == OSC_TYPE_RANGE:
+            self.value_table = get_range_value_table(int(command_and_type[2]), int(command_and_type[3]))
+
+        # bool types only know 0 and 1
+        elif self.type_code in [OSC_TYPE_TRIGGER, OSC_TYPE_TOGGLE]:
+            self.value_table = (0,) + (1,) * 255
+        else:
+            self.value_table = tuple(range(256))
+
+        # changes of the DMX input smaller than this are ignored
+        self.deadband = int(channel_options.get("deadband", 0))
+
+        # triggers and toggles are events which shouldn't wait behind fader updates
+        if "priority" in channel_options:
+            self.high_priority = channel_options["priority"] == "high"
+        else:
+            self.high_priority = self.type_code in osc_high_priority_types
+
+        self.destinations = tuple(destinations)
+
+    def pack_group_value(self, values):
+        """
+        return the encoded int arguments of a channel group
+        """
+
+        return self.value_struct.pack(*values)
+
+    def encode_message(self, value):
+        """
+        return the encoded OSC message of this channel with value as argument
+        """
+
+        return self.datagram_prefix + self.pack_value(value)
+
+    def get_value(self, frame):
+        """
+        return the translated value of this channel or channel group for a DMX frame
+        """
+
+        if self.is_group is True:
+            return tuple([self.value_table[frame[channel_id]] for channel_id in self.channel_ids])
+
+        return self.value_table[frame[self.channel_ids[0]]]
+
+    def describe_value(self, dmx_value, value_to_send):
+        """
+        return a human readable description of a translated value, used for debug logging
+        """
+
+        log_text = "%s => %s" % (self.name, value_to_send)
+        if self.type_code == OSC_TYPE_TOGGLE:
+            log_text += " (%s)" % ("Off" if value_to_send == 0 else "On")
+        elif self.type_code == OSC_TYPE_TRIGGER:
+            log_text += " (%s)" % ("None" if value_to_send == 0 else "Triggered")
+        log_text += " (type: %s) (DMX input: %d on %d)" % (self.type_name, dmx_value, self.channel_num)
+
+        return log_text
+
+
+def get_range_value_table(range_min, range_max):
+    """
+    return the value table of the command type 'range', tables are shared by all channels with the same range
+
+    Parameters
+    ----------
+    range_min : int
+        OSC value of DMX value 0
+    range_max : int
+        OSC value of DMX value 255
+
+    Returns
+    -------
+    tuple
+        OSC value of every DMX value
+    """
+
+    value_table = osc_range_value_tables.get((range_min, range_max))
+
+    if value_table is None:
+        dmx_span = 256
+        range_factor = float(range_max - range_min + 1) / float(dmx_span)
+
+        value_table = tuple(int(range_min + (range_factor * float(value))) for value in range(dmx_span))
+        osc_range_value_tables[(range_min, range_max)] = value_table
+
+    return value_table
+
+
+class OscDestination(object):
+    """
+    OSC destination which collects all messages of a DMX frame and sends them
+    either as single messages or as bundles.
+
+    Messages of high priority channels are queued separately and always sent first.
+    If max_rate is set, queued normal priority messages are only sent if the last update
+    is at least 1/max_rate seconds ago. Until then newer values of a channel replace the
+    queued ones, so only the latest value of every channel gets sent. High priority
+    messages are not held back by max_rate. Messages which don't fit into the socket send
+    buffer stay queued for the next flush.
+
+    Messages with the value the destination received last for a channel are skipped,
+    i.e. if two DMX values translate to the same OSC value.
+
+    Every destination has its own connected UDP socket. The server address is resolved
+    when connecting and refreshed by resolve_osc_destinations(). After repeated send
+    errors the destination is paused with an increasing backoff time. Messages of a paused
+    or not connected destination stay queued and get coalesced, so the receiver gets the
+    latest value of every channel once it is reachable again.
+    """
+
+    __slots__ = ("name", "server", "port", "output_mode", "bundle_max_size", "max_rate", "min_interval",
+                 "pending", "pending_ts", "pending_high", "pending_high_ts", "last_flush_ts", "coalesced_count",
+                 "last_sent", "suppressed_count", "sock", "address", "error_count", "last_error_ts", "backoff_until",
+                 "messages_sent", "datagrams_sent", "messages_deferred", "send_errors")
+
+    def __init__(self, destination_config):
+
+        self.name = destination_config.get("name")
+        self.server = destination_config.get("server")
+        self.port = destination_config.get("port")
+        self.output_mode = destination_config.get("output_mode", default_osc_output_mode)
+        self.bundle_max_size = destination_config.get("bundle_max_size", default_osc_bundle_max_size)
+        self.max_rate = destination_config.get("max_rate", default_osc_max_rate)
+        self.min_interval = 1.0 / self.max_rate if self.max_rate > 0 else 0
+        # dispatch record to value mapping of messages to send with the next flush, per priority
+        self.pending = dict()
+        self.pending_high = dict()
+        # time the oldest queued message of each priority got queued
+        self.pending_ts = None
+        self.pending_high_ts = None
+        self.last_flush_ts = 0
+        self.coalesced_count = 0
+        # dispatch record to value mapping of the values the destination received last
+        self.last_sent = dict()
+        self.suppressed_count = 0
+
+        self.sock = None
+        self.address = None
+        self.error_count = 0
+        self.last_error_ts = None
+        self.backoff_until = None
+
+        self.messages_sent = 0
+        self.datagrams_sent = 0
+        self.messages_deferred = 0
+        self.send_errors = 0
+
+    def get_settings(self):
+        """
+        return all configured options, used to detect changed destinations on config reload
+        """
+
+        return self.server, self.port, self.output_mode, self.bundle_max_size, self.max_rate
+
+    def connect(self):
+        """
+        resolve server address and connect socket if the address changed
+
+        Returns
+        -------
+        bool
+            True if destination is connected
+        """
+
+        try:
+            family, _, _, _, address = getaddrinfo(self.server, self.port, AF_UNSPEC, SOCK_DGRAM)[0]
+        except Exception as e:
+            logging.warning("Unable to resolve address '%s' of OSC destination '%s': %s" %
+                            (self.server, self.name, str(e)))
+            return self.sock is not None
+
+        if self.sock is not None and address == self.address:
+            return True
+
+        try:
+            sock = socket(family, SOCK_DGRAM)
+            sock.setblocking(False)
+            sock.connect(address)
+        except Exception as e:
+            logging.warning("Unable to connect to OSC destination '%s' (%s:%d): %s" %
+                            (self.name, address[0], address[1], str(e)))
+            return self.sock is not None
+
+        logging.debug("Connected to OSC destination '%s' (%s:%d)" % (self.name, address[0], address[1]))
+
+        old_sock = self.sock
+        self.sock = sock
+        self.address = address
+        self.error_count = 0
+        self.backoff_until = None
+
+        if old_sock is not None:
+            old_sock.close()
+
+        return True
+
+    def close(self):
+        """
+        close socket of this destination
+        """
+
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def is_healthy(self):
+        """
+        returns False if the last send to this destination failed
+        """
+
+        return self.sock is not None and self.error_count == 0
+
+    def queue_message(self, osc_command, value):
+        """
+        queue OSC message to be sent with the next flush, replaces a queued value of the same channel
+        """
+
+        pending = self.pending_high if osc_command.high_priority is True else self.pending
+
+        # the destination already has this value
+        if self.last_sent.get(osc_command) == value:
+            # a queued value in between became obsolete
+            if pending.pop(osc_command, None) is not None:
+                self.coalesced_count += 1
+            self.suppressed_count += 1
+            return
+
+        if osc_command in pending:
+            self.coalesced_count += 1
+        elif len(pending) == 0:
+            if osc_command.high_priority is True:
+                self.pending_high_ts = time.time()
+            else:
+                self.pending_ts = time.time()
+
+        pending[osc_command] = value
+
+    def has_pending(self):
+        """
+        returns True if messages of any priority are queued
+        """
+
+        return len(self.pending_high) > 0 or len(self.pending) > 0
+
+    def get_flush_delay(self):
+        """
+        return seconds until queued messages may be sent according to max_rate and the state of the destination
+        """
+
+        now = time.time()
+
+        if self.backoff_until is not None and now < self.backoff_until:
+            return self.backoff_until - now
+
+        # resolve_osc_destinations() connects the destination in the background
+        if self.sock is None:
+            return osc_destination_reconnect_interval
+
+        if self.min_interval == 0 or len(self.pending_high) > 0:
+            return 0
+
+        return max(0, self.last_flush_ts + self.min_interval - now)
+
+    def flush(self):
+        """
+        send all queued high priority OSC messages and the other queued messages if max_rate allows it
+        """
+
+        # keep messages queued while destination is paused, newer values replace them
+        if self.backoff_until is not None and time.time() < self.backoff_until:
+            return
+
+        # never resolve here, it would block the frame path, resolve_osc_destinations() reconnects
+        if self.sock is None:
+            return
+
+        send_normal = len(self.pending) > 0
+
+        if send_normal is True and self.min_interval > 0:
+            now = time.time()
+            if now - self.last_flush_ts < self.min_interval:
+                send_normal = False
+            else:
+                self.last_flush_ts = now
+
+        if send_normal is False and len(self.pending_high) == 0:
+            return
+
+        pending_high = list(self.pending_high.items())
+        pending_high_ts = self.pending_high_ts
+        self.pending_high = dict()
+        self.pending_high_ts = None
+
+        pending = list()
+        pending_ts = None
+        if send_normal is True:
+            pending = list(self.pending.items())
+            pending_ts = self.pending_ts
+            self.pending = dict()
+            self.pending_ts = None
+
+        num_sent = 0
+        try:
+            # bundles keep the messages of a frame together, high priority messages go first
+            if self.output_mode == "bundle":
+                num_sent = len(pending_high) + len(pending) - len(self.send_messages(pending_high + pending))
+            else:
+                num_sent = len(pending_high) - len(self.send_messages(pending_high))
+
+                # normal priority messages wait while the send buffer is full
+                if num_sent == len(pending_high):
+                    num_sent += len(pending) - len(self.send_messages(pending))
+
+            self.messages_deferred += len(pending) - max(0, num_sent - len(pending_high))
+        except Exception as e:
+            # messages which failed are sent again once the destination isn't paused anymore
+            self.register_error(str(e))
+
+        unsent_high = pending_high[num_sent:]
+        unsent = pending[max(0, num_sent - len(pending_high)):]
+
+        if len(pending_high) > len(unsent_high):
+            metrics.osc_send_latency["high"].observe(time.time() - pending_high_ts)
+        if len(pending) > len(unsent):
+            metrics.osc_send_latency["normal"].observe(time.time() - pending_ts)
+
+        # queue unsent messages again, values queued in the meantime are newer
+        for queued_messages, unsent_messages, priority in [(self.pending_high, unsent_high, "high"),
+                                                           (self.pending, unsent, "normal")]:
+            if len(unsent_messages) == 0:
+                continue
+
+            for osc_command, value in unsent_messages:
+                queued_messages.setdefault(osc_command, value)
+
+            if priority == "high":
+                self.pending_high_ts = pending_high_ts
+            else:
+                self.pending_ts = pending_ts
+
+        # UDP errors (ICMP port unreachable) are reported on the following send,
+        # only consider destination recovered if no error happened for a while
+        if self.error_count > 0 and time.time() - self.last_error_ts > osc_destination_recovery_time:
+            logging.info("Sending to OSC destination '%s' succeeded again" % self.name)
+            self.error_count = 0
+            self.backoff_until = None
+
+    def send_messages(self, messages):
+        """
+        encode and send OSC messages, stops if the socket send buffer is full
+
+        Parameters
+        ----------
+        messages : list
+            tuples of dispatch record and value
+
+        Returns
+        -------
+        list
+            tuples of dispatch record and value of the messages which haven't been sent
+        """
+
+        if len(messages) == 0:
+            return messages
+
+        if osc_datagram_cache is None:
+            datagrams = [osc_command.datagram_prefix + osc_command.pack_value(value) for osc_command, value in messages]
+        else:
+            datagrams = [osc_datagram_cache.get(osc_command, value) for osc_command, value in messages]
+
+        if self.output_mode == "bundle":
+            datagrams = build_osc_bundles(datagrams, self.bundle_max_size)
+
+        num_datagrams_sent = send_datagrams(self.sock, datagrams)
+
+        if num_datagrams_sent == len(datagrams):
+            num_messages_sent = len(messages)
+        elif self.output_mode == "bundle":
+            num_messages_sent = sum([count_osc_bundle_messages(bundle) for bundle in datagrams[:num_datagrams_sent]])
+        else:
+            num_messages_sent = num_datagrams_sent
+
+        self.messages_sent += num_messages_sent
+        self.datagrams_sent += num_datagrams_sent
+        self.last_sent.update(messages[:num_messages_sent])
+
+        if startup_timing is not None and num_messages_sent > 0:
+            report_startup_timing()
+
+        return messages[num_messages_sent:]
+
+    def register_error(self, reason):
+        """
+        count a failed send and pause destination after too many consecutive errors
+        """
+
+        self.error_count += 1
+        self.send_errors += 1
+        self.last_error_ts = time.time()
+
+        if self.error_count < osc_destination_max_errors:
+            logging.warning("Sending to OSC destination '%s' failed: %s" % (self.name, reason))
+            return
+
+        backoff = min(osc_destination_backoff_min * 2 ** (self.error_count - osc_destination_max_errors),
+                      osc_destination_backoff_max)
+        self.backoff_until = time.time() + backoff
+
+        logging.warning("Sending to OSC destination '%s' failed %d times in a row, pausing for %0.1fs: %s" %
+                        (self.name, self.error_count, backoff, reason))
+
+
+class OscDatagramCache(object):
+    """
+    bounded LRU cache of encoded OSC messages per channel and value
+
+    Parameters
+    ----------
+    max_size : int
+        max number of cached messages, the least recently used message gets evicted
+    """
+
+    __slots__ = ("max_size", "datagrams", "hits", "misses")
+
+    def __init__(self, max_size):
+
+        self.max_size = max_size
+        self.datagrams = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, osc_command, value):
+        """
+        return the encoded OSC message of a dispatch record with value as argument
+        """
+
+        key = (osc_command, value)
+
+        # re-insert to mark as most recently used
+        datagram = self.datagrams.pop(key, None)
+
+        if datagram is None:
+            self.misses += 1
+            datagram = osc_command.encode_message(value)
+            if len(self.datagrams) >= self.max_size:
+                self.datagrams.popitem(last=False)
+        else:
+            self.hits += 1
+
+        self.datagrams[key] = datagram
+
+        return datagram
+
+
+def send_datagrams(sock, datagrams):
+    """
+    send datagrams on a connected socket, with a single sendmmsg syscall if available
+
+    Parameters
+    ----------
+    sock : socket
+        connected UDP socket
+    datagrams : list
+        list of datagrams (bytes) to send
+
+    Returns
+    -------
+    int
+        number of datagrams sent, less than all if the socket send buffer is full
+    """
+
+    num_datagrams = len(datagrams)
+
+    if libc_sendmmsg is None or num_datagrams == 1:
+        for num_sent, datagram in enumerate(datagrams):
+            try:
+                sock.send(datagram)
+            except (IOError, OSError) as e:
+                if e.errno in osc_send_buffer_full_errors:
+                    return num_sent
+                raise
+        return num_datagrams
+
+    io_vectors = (IoVec * num_datagrams)()
+    messages = (MMsgHdr * num_datagrams)()
+    io_vectors_address = ctypes.addressof(io_vectors)
+    io_vector_size = ctypes.sizeof(IoVec)
+
+    for index, datagram in enumerate(datagrams):
+        io_vectors[index].iov_base = ctypes.cast(ctypes.c_char_p(datagram), ctypes.c_void_p).value
+        io_vectors[index].iov_len = len(datagram)
+        messages[index].msg_hdr.msg_iov = io_vectors_address + index * io_vector_size
+        messages[index].msg_hdr.msg_iovlen = 1
+
+    num_sent = 0
+    while num_sent < num_datagrams:
+        result = libc_sendmmsg(sock.fileno(), ctypes.byref(messages, num_sent * ctypes.sizeof(MMsgHdr)),
+                               num_datagrams - num_sent, 0)
+        if result < 0:
+            error_number = ctypes.get_errno()
+            if error_number in osc_send_buffer_full_errors:
+                return num_sent
+            raise OSError(error_number, os.strerror(error_number))
+
+        num_sent += result
+
+    return num_sent
+
+
+def flush_osc_destinations():
+    """
+    send queued messages of all OSC destinations which are due according to their max_rate
+    """
+
+    for destination in config["osc.destinations"].values():
+        destination.flush()
+
+
+def get_osc_flush_interval():
+    """
+    return the smallest update interval of all rate limited OSC destinations or None if no destination is limited
+    """
+
+    intervals = [d.min_interval for d in config["osc.destinations"].values() if d.min_interval > 0]
+
+    if len(intervals) == 0:
+        return None
+
+    return min(intervals)
+
+
+def get_osc_tick_interval(max_interval=None):
+    """
+    return seconds until queued OSC messages are due or until the next update of rate limited destinations
+
+    Parameters
+    ----------
+    max_interval : float
+        upper limit of the returned interval
+
+    Returns
+    -------
+    float
+        seconds to wait before flushing the OSC destinations or None if there is nothing to wait for
+    """
+
+    intervals = [d.get_flush_delay() for d in config["osc.destinations"].values() if d.has_pending() is True]
+
+    flush_interval = get_osc_flush_interval()
+    if flush_interval is not None:
+        intervals.append(flush_interval)
+    if max_interval is not None:
+        intervals.append(max_interval)
+
+    if len(intervals) == 0:
+        return None
+
+    return max(osc_send_retry_interval, min(intervals))
+
+
+def log_osc_destination_stats():
+    """
+    log the number of coalesced updates of all rate limited OSC destinations
+    """
+
+    for destination in config["osc.destinations"].values():
+        if destination.max_rate > 0:
+            logging.info("OSC destination '%s': %d updates coalesced (max_rate: %s)" %
+                         (destination.name, destination.coalesced_count, destination.max_rate))
+
+    if osc_datagram_cache is not None:
+        logging.info("OSC message cache: %d hits, %d misses (size: %d)" %
+                     (osc_datagram_cache.hits, osc_datagram_cache.misses, osc_datagram_cache.max_size))
+
+
+def log_metrics_summary(interval):
+    """
+    log a metrics summary every interval seconds, meant to run in a background thread
+    """
+
+    while True:
+        time.sleep(interval)
+        logging.info(metrics.format_summary(config["osc.destinations"], interval))
+
+
+def start_metrics_http_server(listen_address, port):
+    """
+    serve metrics in Prometheus text format on http://listen_address:port/metrics in a background thread
+    """
+
+    try:
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+    except ImportError:
+        from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split("?")[0] not in ["/", "/metrics"]:
+                self.send_error(404)
+                return
+
+            body = metrics.format_prometheus(config["osc.destinations"]).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *log_args):
+            pass
+
+    try:
+        server = HTTPServer((listen_address, port), MetricsRequestHandler)
+    except Exception as e:
+        logging.error("Unable to start metrics HTTP server on %s:%d: %s" % (listen_address, port, str(e)))
+        return
+
+    logging.info("Metrics available on http://%s:%d/metrics" % (listen_address, port))
+
+    server_thread = threading.Thread(target=server.serve_forever, name="metrics")
+    server_thread.daemon = True
+    server_thread.start()
+
+
+def start_metrics():
+    """
+    start metrics HTTP server and summary logging as configured
+    """
+
+    if config["metrics.enabled"] == "1":
+        start_metrics_http_server(config["metrics.listen_address"], config["metrics.port"])
+
+    log_interval = config["metrics.log_interval"]
+    if log_interval == 0 and args.profile is True:
+        log_interval = default_metrics_profile_interval
+
+    if log_interval > 0:
+        logger_thread = threading.Thread(target=log_metrics_summary, args=(log_interval,), name="metrics-log")
+        logger_thread.daemon = True
+        logger_thread.start()
+
+
+def connect_osc_destinations():
+    """
+    connect sockets of all configured OSC destinations
+    """
+
+    for destination in config["osc.destinations"].values():
+        if destination.connect() is False:
+            destination.register_error("not connected")
+
+
+def resolve_osc_destinations():
+    """
+    periodically re-resolve the addresses of all OSC destinations and retry destinations
+    which are not connected more often, meant to run in a background thread
+    """
+
+    last_resolve_ts = time.time()
+
+    while True:
+        time.sleep(osc_destination_reconnect_interval)
+
+        resolve_all = time.time() - last_resolve_ts >= osc_destination_resolve_interval
+        if resolve_all is True:
+            last_resolve_ts = time.time()
+
+        for destination in list(config["osc.destinations"].values()):
+            if resolve_all is True or destination.sock is None:
+                destination.connect()
+
+
+def build_osc_bundles(messages, max_size):
+    """
+    pack encoded OSC messages into as few bundles as possible
+
+    Parameters
+    ----------
+    messages : list
+        list of encoded OSC messages
+    max_size : int
+        max size of a bundle datagram in bytes, a message which doesn't fit into an
+        empty bundle gets a bundle of its own
+
+    Returns
+    -------
+    list
+        list of encoded OSC bundles
+    """
+
+    bundles = list()
+    bundle = [osc_bundle_header]
+    bundle_size = len(osc_bundle_header)
+
+    for message in messages:
+        element_size = 4 + len(message)
+
+        if bundle_size + element_size > max_size and len(bundle) > 1:
+            bundles.append(b"".join(bundle))
+            bundle = [osc_bundle_header]
+            bundle_size = len(osc_bundle_header)
+
+        bundle.append(pack(">i", len(message)))
+        bundle.append(message)
+        bundle_size += element_size
+
+    if len(bundle) > 1:
+        bundles.append(b"".join(bundle))
+
+    return bundles
+
+
+def count_osc_bundle_messages(bundle):
+    """
+    return the number of messages in an encoded OSC bundle built by build_osc_bundles
+    """
+
+    num_messages = 0
+    position = len(osc_bundle_header)
+
+    while position < len(bundle):
+        position += 4 + unpack_from(">i", bundle, position)[0]
+        num_messages += 1
+
+    return num_messages
+
+
+def parse_command_line():
+    """parse command line arguments
+    Also add current version and version date to description
+    """
+
+    # define command line options
+    parser = argparse.ArgumentParser(
+        description=__description__ + "\nVersion: " + __version__ + " (" + __version_date__ + ")",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("-c", "--config", default=default_config_file_path, dest="config_file",
+                        help="points to the config file to read config data from " +
+                             "which is not installed under the default path '" +
+                             default_config_file_path + "'",
+                        metavar="dmx_to_osc.ini")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="be verbose and print debug information")
+    parser.add_argument("--profile", action='store_true',
+                        help="log a metrics summary (frames/s, OSC messages/s, processing time) periodically")
+    parser.add_argument("--asyncio", action='store_true',
+                        help="receive Art-Net and send OSC messages with the asyncio engine (python 3 only)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="distribute the universes across this number of OSC worker processes (Art-Net only)",
+                        metavar="NUM")
+    parser.add_argument("--capture", metavar="FILE",
+                        help="append all accepted DMX frames to this capture file")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="send the DMX frames of this capture file instead of listening to the inputs")
+    parser.add_argument("--watch-config", action='store_true',
+                        help="reload the config file if it changes, it is always reloaded on SIGHUP")
+    parser.add_argument("--replay-speed", type=float, default=1.0, metavar="FACTOR",
+                        help="replay speed, 1 keeps the original timing, 0 replays as fast as possible (default: 1)")
+    parser.add_argument("--osc-cache-size", type=int, default=0, metavar="NUM",
+                        help="keep up to NUM encoded OSC messages in a LRU cache (default: 0 = disabled)")
+    parser.add_argument("--config-cache", metavar="FILE",
+                        help="keep the parsed config in this file and load it from there on start "
+                             "as long as the config file doesn't change")
+    parser.add_argument("--startup-timing", action='store_true',
+                        help="log the duration of all startup phases once the first OSC message got sent")
+
+    return parser.parse_args()
+
+
+def parse_config_inputs_section(handler, section):
+    this_config_dict = dict()
+
+    config_items = ["enabled", "universe"]
+
+    if section == "art-net":
+        config_items.extend(["listen_address", "receive_buffer_size", "merge_mode", "merge_sources",
+                             "source_timeout"])
+
+    if section == "sacn":
+        config_items.extend(["listen_address", "receive_buffer_size"])
+        default_universe = default_sacn_universe
+    else:
+        default_universe = default_dmx_universe
+
+    if section not in handler.sections():
+        # sACN input is optional and missing in older config files
+        if section != "sacn":
+            logging.warning("Section '%s' not found in config file" % section)
+        this_config_dict["%s.universe" % section] = default_universe
+        this_config_dict["%s.enabled" % section] = "0"
+    else:
+        section_options = dict(handler.items(section))
+        for item in config_items:
+            config_dict_name = "%s.%s" % (section, item)
+            if item in section_options:
+                this_config_dict[config_dict_name] = section_options[item].strip()
+                logging.debug("Config: %s = %s" % (config_dict_name, this_config_dict[config_dict_name]))
+
+            if item == "universe" and (this_config_dict.get(config_dict_name) is None
+                                       or len(this_config_dict.get(config_dict_name)) == 0):
+                this_config_dict[config_dict_name] = default_universe
+                logging.debug("Config: option %s not set. Using default value: %s" %
+                              (config_dict_name, str(default_universe)))
+
+            if item == "enabled" and (this_config_dict.get(config_dict_name) is None
+                                      or len(this_config_dict.get(config_dict_name)) == 0):
+                this_config_dict[config_dict_name] = "1"
+
+    return this_config_dict
+
+
+def parse_config_metrics_section(handler):
+    this_config_dict = dict()
+
+    section = "metrics"
+
+    this_config_dict["metrics.enabled"] = "0"
+    this_config_dict["metrics.listen_address"] = default_metrics_listen_address
+    this_config_dict["metrics.port"] = default_metrics_port
+    this_config_dict["metrics.log_interval"] = 0
+
+    if section not in handler.sections():
+        return this_config_dict
+
+    section_options = dict(handler.items(section))
+    for item in ["enabled", "listen_address", "port", "log_interval"]:
+        config_dict_name = "%s.%s" % (section, item)
+        if item in section_options:
+            value = section_options[item].strip()
+            if len(value) == 0:
+                continue
+            if item in ["port", "log_interval"]:
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ConfigError("metrics option '%s' must be int" % item)
+            this_config_dict[config_dict_name] = value
+            logging.debug("Config: %s = %s" % (config_dict_name, this_config_dict[config_dict_name]))
+
+    return this_config_dict
+
+
+def parse_own_config(config_file):
+    """parsing and basic validation of own config file
+    Parameters
+    ----------
+    config_file : str
+        The file location of the config file
+    Returns
+    -------
+    dict
+        a dictionary with all config options parsed from the config file
+    Raises
+    ------
+    ConfigError
+        if the config file can't be read or contains problems
+    """
+
+    config_dict = dict()
+
+    config_problem = False
+
+    logging.debug("Parsing config file: %s" % config_file)
+
+    if config_file is None or config_file == "":
+        raise ConfigError("Config file not defined.")
+
+    # setup config parser and read config
+    config_handler = configparser.SafeConfigParser()
+
+    try:
+        files_read = config_handler.read(config_file)
+    except configparser.Error as e:
+        raise ConfigError("Error during config file parsing: %s" % e)
+    except Exception as e:
+        raise ConfigError("Unable to open file '%s': %s" % (config_file, str(e)))
+
+    if len(files_read) == 0:
+        raise ConfigError("Unable to open file '%s'" % config_file)
+
+    config_dict.update(parse_config_inputs_section(config_handler, "art-net"))
+    config_dict.update(parse_config_inputs_section(config_handler, "ola-dmx"))
+    config_dict.update(parse_config_inputs_section(config_handler, "sacn"))
+    config_dict.update(parse_config_metrics_section(config_handler))
+
+    if config_dict["ola-dmx.enabled"] == "1" and load_ola_module() is False:
+        logging.warning("OLA python libs not found.")
+        config_dict["ola-dmx.enabled"] = "0"
+
+    for input_section in ["art-net", "ola-dmx", "sacn"]:
+        try:
+            config_dict["%s.universe" % input_section] = int(config_dict["%s.universe" % input_section])
+        except ValueError:
+            config_problem = True
+            logging.error("%s option 'universe' must be int" % input_section)
+            config_dict["%s.universe" % input_section] = default_dmx_universe
+
+    # OSC sections without universe option use the universe of the active input
+    if config_dict["ola-dmx.enabled"] == "1":
+        input_universe = config_dict["ola-dmx.universe"]
+    elif config_dict["art-net.enabled"] != "1" and config_dict["sacn.enabled"] == "1":
+        input_universe = config_dict["sacn.universe"]
+    else:
+        input_universe = config_dict["art-net.universe"]
+
+    if config_dict.get("sacn.listen_address") is None or len(config_dict["sacn.listen_address"]) == 0:
+        config_dict["sacn.listen_address"] = default_sacn_listen_address
+
+    for input_section in ["art-net", "sacn"]:
+        config_dict_name = "%s.receive_buffer_size" % input_section
+        value = config_dict.get(config_dict_name)
+        if value is None or len(value) == 0:
+            config_dict[config_dict_name] = default_receive_buffer_size
+            continue
+        try:
+            config_dict[config_dict_name] = int(value)
+        except ValueError:
+            config_dict[config_dict_name] = -1
+        if config_dict[config_dict_name] < 0:
+            config_problem = True
+            logging.error("%s option 'receive_buffer_size' must be int of 0 or greater" % input_section)
+            config_dict[config_dict_name] = default_receive_buffer_size
+
+    # handling of multiple Art-Net senders
+    merge_mode = config_dict.get("art-net.merge_mode")
+    if merge_mode is None or len(merge_mode) == 0:
+        merge_mode = default_artnet_merge_mode
+    if merge_mode.lower() not in artnet_merge_modes:
+        config_problem = True
+        logging.error("art-net option 'merge_mode' must be one of: %s" % ", ".join(artnet_merge_modes))
+    config_dict["art-net.merge_mode"] = merge_mode.lower()
+
+    for option, option_type, default_value in [("merge_sources", int, default_artnet_merge_sources),
+                                               ("source_timeout", float, default_artnet_source_timeout)]:
+        config_dict_name = "art-net.%s" % option
+        value = config_dict.get(config_dict_name)
+        if value is None or len(value) == 0:
+            config_dict[config_dict_name] = default_value
+            continue
+        try:
+            value = option_type(value)
+        except ValueError:
+            value = 0
+        if value <= 0:
+            config_problem = True
+            logging.error("art-net option '%s' must be a number greater than 0" % option)
+            value = default_value
+        config_dict[config_dict_name] = value
+
+    if config_dict["art-net.enabled"] == "1" and \
+            (config_dict.get("art-net.listen_address") is None or
+             len(config_dict["art-net.listen_address"]) == 0):
+        config_problem = True
+        logging.error("art-net option 'listen_address' not configured.")
+
+    # universe to channel mapping, gets filled for every universe used in OSC sections
+    mapping = dict()
+
+    channel_prefix = "channel"
+    channel_group_prefix = "channels"
+
+    # get osc sections
+    for config_section in config_handler.sections():
+
+        if config_section not in ["ola-dmx", "art-net", "sacn", "metrics"] and \
+                not config_section.startswith("osc/"):
+            logging.warning("ignoring invalid section '%s' in config file." % config_section)
+            continue
+
+        if config_section.startswith("osc/"):
+            osc_destination = dict()
+            osc_destination["name"] = config_section.split("/")[1]
+
+            section_config_options = list(dict(config_handler.items(config_section)))
+
+            if "enabled" in section_config_options:
+                if config_handler.get(config_section, "enabled").strip() == "0":
+                    logging.info("config section '%s' is disabled and will be skipped" % config_section)
+                    continue
+
+            config_option_name = "server"
+            if config_option_name in section_config_options:
+                osc_destination[config_option_name] = config_handler.get(config_section, config_option_name).strip()
+                if len(osc_destination[config_option_name]) == 0:
+                    config_problem = True
+                    logging.error("option '%s' empty for OSC destination '%s'"
+                                  % (config_option_name, osc_destination["name"]))
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
+            else:
+                config_problem = True
+                logging.error("Option '%s' missing in config section '%s'" % (config_option_name, config_section))
+
+            config_option_name = "port"
+            if config_option_name in section_config_options:
+                # store port as int to save type casting on every message sent
+                try:
+                    osc_destination[config_option_name] = \
+                        int(config_handler.get(config_section, config_option_name).strip())
+                except ValueError:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be int"
+                                  % (config_option_name, osc_destination["name"]))
+                    continue
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
+            else:
+                config_problem = True
+                logging.error("Option '%s' missing in config section '%s'" % (config_option_name, config_section))
+                continue
+
+            config_option_name = "output_mode"
+            osc_destination[config_option_name] = default_osc_output_mode
+            if config_option_name in section_config_options:
+                osc_destination[config_option_name] = config_handler.get(config_section, config_option_name).strip()
+                if osc_destination[config_option_name] not in osc_output_modes:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be one of: %s"
+                                  % (config_option_name, osc_destination["name"], ", ".join(osc_output_modes)))
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
+
+            config_option_name = "bundle_max_size"
+            osc_destination[config_option_name] = default_osc_bundle_max_size
+            if config_option_name in section_config_options:
+                try:
+                    osc_destination[config_option_name] = \
+                        int(config_handler.get(config_section, config_option_name).strip())
+                except ValueError:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be int"
+                                  % (config_option_name, osc_destination["name"]))
+                if osc_destination[config_option_name] < osc_bundle_min_size:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be at least %d"
+                                  % (config_option_name, osc_destination["name"], osc_bundle_min_size))
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
+
+            config_option_name = "max_rate"
+            osc_destination[config_option_name] = default_osc_max_rate
+            if config_option_name in section_config_options:
+                try:
+                    osc_destination[config_option_name] = \
+                        float(config_handler.get(config_section, config_option_name).strip())
+                except ValueError:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be a number"
+                                  % (config_option_name, osc_destination["name"]))
+                if osc_destination[config_option_name] < 0:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must not be negative"
+                                  % (config_option_name, osc_destination["name"]))
+                    osc_destination[config_option_name] = default_osc_max_rate
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), osc_destination[config_option_name]))
+
+            config_option_name = "universe"
+            section_universe = input_universe
+            if config_option_name in section_config_options:
+                try:
+                    section_universe = int(config_handler.get(config_section, config_option_name).strip())
+                except ValueError:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must be int"
+                                  % (config_option_name, osc_destination["name"]))
+                if section_universe < 0:
+                    config_problem = True
+                    logging.error("option '%s' for OSC destination '%s' must not be negative"
+                                  % (config_option_name, osc_destination["name"]))
+                logging.debug("Config: %s = %s" %
+                              ("%s.%s" % (config_section, config_option_name), section_universe))
+
+            if mapping.get(section_universe) is None:
+                mapping[section_universe] = dict.fromkeys(range(dmx_num_channels), None)
+
+            universe_mapping = mapping.get(section_universe)
+
+            for key, channel_osc_command in dict(config_handler.items(config_section)).items():
+
+                channel_osc_command = channel_osc_command.strip()
+
+                # skip expected config options
+                if key in ["server", "port", "enabled", "output_mode", "bundle_max_size", "max_rate", "universe"]:
+                    continue
+
+                key_prefix = key.split("_")[0]
+
+                if key_prefix not in [channel_prefix, channel_group_prefix]:
+                    config_problem = True
+                    logging.warning("config item '%s' starts with wrong prefix, expected: '%s' or '%s'" %
+                                    (key, channel_prefix, channel_group_prefix))
+                    continue
+
+                # a channel group defines a range of channels, i.e. channels_37-40
+                try:
+                    if key_prefix == channel_group_prefix:
+                        channel_name, last_channel_name = [int(name) for name in key.split("_")[1].split("-")]
+                    else:
+                        channel_name = last_channel_name = int(key.split("_")[1])
+                except ValueError:
+                    config_problem = True
+                    if key_prefix == channel_group_prefix:
+                        logging.warning("config item '%s' channels must be int range $FIRST-$LAST but '%s' given" %
+                                        (key, str(key.split("_")[1])))
+                    else:
+                        logging.warning(
+                            "config item '%s' channel must be int but '%s' given" % (key, str(key.split("_")[1])))
+                    continue
+
+                # i.e. channel 1 is represented with id 0 in DMX data and so on
+                channel_id = channel_name - 1
+                channel_ids = tuple(range(channel_id, last_channel_name))
+
+                if channel_name == 0:
+                    config_problem = True
+                    logging.warning("channels in section '%s' need to start with 1" % config_section)
+                    continue
+
+                if last_channel_name > dmx_num_channels:
+                    config_problem = True
+                    logging.warning("config item '%s' exceeds the maximum number of valid DMX channels: %d" %
+                                    (key, dmx_num_channels))
+                    continue
+
+                if key_prefix == channel_group_prefix and last_channel_name <= channel_name:
+                    config_problem = True
+                    logging.warning("config item '%s' needs a range of at least two channels" % key)
+                    continue
+
+                # check command and type
+                command_and_type, channel_options = split_channel_options(channel_osc_command)
+
+                for option_name, option_value in channel_options.items():
+                    if option_name not in osc_channel_options:
+                        config_problem = True
+                        logging.warning("invalid option '%s' for channel '%s', valid options: %s"
+                                        % (option_name, channel_name, ", ".join(osc_channel_options)))
+                    elif option_name == "deadband" and (not option_value.isdigit() or int(option_value) > 255):
+                        config_problem = True
+                        logging.warning("option 'deadband' for channel '%s' must be int between 0 and 255, got '%s'"
+                                        % (channel_name, option_value))
+                    elif option_name == "priority" and option_value not in osc_channel_priorities:
+                        config_problem = True
+                        logging.warning("option 'priority' for channel '%s' must be one of %s, got '%s'"
+                                        % (channel_name, ", ".join(osc_channel_priorities), option_value))
+
+                if len(command_and_type) == 1:
+                    config_problem = True
+                    logging.warning("missing OSC command type for command '%s' for channel '%s'"
+                                    % (command_and_type[0], channel_name))
+                    continue
+
+                command_type = command_and_type[1]
+                if command_type not in ["value", "trigger", "toggle", "range"]:
+                    config_problem = True
+                    logging.warning("invalid OSC command type '%s' for command '%s' for channel '%s'"
+                                    % (command_and_type[0], command_and_type[0], channel_name))
+                    continue
+
+                if command_type == "range":
+                    if len(command_and_type) != 4:
+                        config_problem = True
+                        logging.warning(
+                            "wrong format '%s' for OSC command type 'range' for command '%s' for channel '%s'"
+                            % (channel_osc_command, command_and_type[0], channel_name))
+                        continue
+                    try:
+                        int(command_and_type[2])
+                        int(command_and_type[3])
+                    except ValueError:
+                        config_problem = True
+                        logging.warning(
+                            "command type 'range' start and end for channel '%s' must be int, got '%s:%s'" %
+                            (channel_name, str(command_and_type[2]), str(command_and_type[3])))
+                        continue
+
+                # add command to mapping, all channels of a group share one entry
+                channel_mapping = universe_mapping.get(channel_id)
+                if channel_mapping is None:
+                    channel_mapping = {"command": channel_osc_command, "channels": channel_ids,
+                                       "destinations": [osc_destination]}
+                else:
+                    if channel_mapping.get("command") != channel_osc_command or \
+                            channel_mapping.get("channels") != channel_ids:
+                        config_problem = True
+                        logging.error("channel definition mismatch between '%s' and '%s' for channel '%s' "
+                                      "in universe '%d'" %
+                                      (channel_mapping.get("destinations")[0].get("name"),
+                                       osc_destination.get("name"), channel_name, section_universe))
+
+                    channel_mapping.get("destinations").append(osc_destination)
+
+                for group_channel_id in channel_ids:
+                    defined_mapping = universe_mapping.get(group_channel_id)
+                    if defined_mapping is not None and defined_mapping is not channel_mapping:
+                        config_problem = True
+                        logging.error("channel '%d' of '%s' in section '%s' is already defined in universe '%d'" %
+                                      (group_channel_id + 1, key, config_section, section_universe))
+                        continue
+
+                    universe_mapping[group_channel_id] = channel_mapping
+
+    if config_problem is True:
+        raise ConfigError("found config problems during parsing.")
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        for universe, universe_mapping in sorted(mapping.items()):
+            for key, val in universe_mapping.items():
+
+                if val is not None:
+                    logging.debug("Config: universe %d, channel %d, command: %s, destinations: %s"
+                                  % (universe, key + 1, val.get("command"),
+                                     str([d['name'] for d in val.get("destinations")])))
+
+    config_dict["osc"] = mapping
+
+    return compile_config(config_dict)
+
+
+def compile_config(config_dict):
+    """
+    compile OSC destinations and dispatch tables of a parsed config
+
+    Parameters
+    ----------
+    config_dict : dict
+        parsed config, either returned by parse_own_config() or read from the config cache
+
+    Returns
+    -------
+    dict
+        the config with the compiled items added
+    """
+
+    config_dict["osc.destinations"] = compile_osc_destinations(config_dict["osc"])
+    config_dict["osc.universes"] = compile_osc_universes(config_dict["osc"], config_dict["osc.destinations"])
+
+    return config_dict
+
+
+def get_parsed_config(config_dict):
+    """
+    return a copy of a config without the compiled items, i.e. to cache it or to hand it to another process
+
+    Parameters
+    ----------
+    config_dict : dict
+        the config, see parse_own_config()
+
+    Returns
+    -------
+    dict
+        the parsed config, ready to be compiled again with compile_config()
+    """
+
+    return dict((key, value) for key, value in config_dict.items() if key not in config_compiled_items)
+
+
+def get_config_cache_key(config_file):
+    """
+    return the key of the config file in the config cache, it changes with the content of the file
+
+    Parameters
+    ----------
+    config_file : str
+        path to the config file
+
+    Returns
+    -------
+    tuple
+        cache format, script version, modification time and SHA-1 of the config file
+        or None if the config file can't be read
+    """
+
+    import hashlib
+
+    try:
+        mtime = os.stat(config_file).st_mtime
+        with open(config_file, "rb") as config_fd:
+            content_hash = hashlib.sha1(config_fd.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+    return config_cache_format, __version__, mtime, content_hash
+
+
+def read_config_cache(cache_file, cache_key):
+    """
+    read a parsed config from the config cache
+
+    Parameters
+    ----------
+    cache_file : str
+        path to the config cache
+    cache_key : tuple
+        key of the config file, see get_config_cache_key()
+
+    Returns
+    -------
+    dict
+        the parsed config without compiled items or None if the cache is missing, invalid or outdated
+    """
+
+    import pickle
+
+    try:
+        with open(cache_file, "rb") as cache_fd:
+            cached_key, config_dict = pickle.load(cache_fd)
+    except Exception as e:
+        logging.debug("Unable to read config cache '%s': %s" % (cache_file, str(e)))
+        return None
+
+    if cached_key != cache_key:
+        logging.debug("Config cache '%s' is outdated" % cache_file)
+        return None
+
+    # OLA input was available when the cache got written, make sure it still is
+    if config_dict.get("ola-dmx.enabled") == "1" and load_ola_module() is False:
+        return None
+
+    return config_dict
+
+
+def write_config_cache(cache_file, cache_key, config_dict):
+    """
+    write a parsed config to the config cache, the file gets replaced atomically
+
+    Parameters
+    ----------
+    cache_file : str
+        path to the config cache
+    cache_key : tuple
+        key of the config file the config got parsed from, see get_config_cache_key()
+    config_dict : dict
+        parsed config, compiled items are not written
+    """
+
+    import pickle
+
+    cached_config = get_parsed_config(config_dict)
+
+    temp_file = "%s.%d" % (cache_file, os.getpid())
+
+    try:
+        with open(temp_file, "wb") as cache_fd:
+            pickle.dump((cache_key, cached_config), cache_fd, pickle.HIGHEST_PROTOCOL)
+        os.rename(temp_file, cache_file)
+    except Exception as e:
+        logging.warning("Unable to write config cache '%s': %s" % (cache_file, str(e)))
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        return
+
+    logging.debug("Wrote config cache '%s'" % cache_file)
+
+
+def load_own_config(config_file, cache_file=None):
+    """
+    load the config file, from the config cache if it is up to date
+
+    The config cache holds the parsed and validated config of a config file. It gets
+    rebuilt if the config file changes, the compiled items are always built on load.
+
+    Parameters
+    ----------
+    config_file : str
+        path to the config file
+    cache_file : str
+        path to the config cache, None to always parse the config file
+
+    Returns
+    -------
+    dict
+        the config, see parse_own_config()
+
+    Raises
+    ------
+    ConfigError
+        if the config file can't be read or contains problems
+    """
+
+    if cache_file is None:
+        config_dict = parse_own_config(config_file)
+        mark_startup_phase("config loaded", "parsed")
+        return config_dict
+
+    cache_key = get_config_cache_key(config_file)
+
+    config_dict = None
+    if cache_key is not None:
+        config_dict = read_config_cache(cache_file, cache_key)
+
+    if config_dict is not None:
+        logging.debug("Loaded config from cache '%s'" % cache_file)
+        config_dict = compile_config(config_dict)
+        mark_startup_phase("config loaded", "from cache")
+        return config_dict
+
+    config_dict = parse_own_config(config_file)
+
+    # OLA was enabled but is missing, parse again once it got installed
+    if cache_key is not None and ola_module_present is not False:
+        write_config_cache(cache_file, cache_key, config_dict)
+
+    mark_startup_phase("config loaded", "parsed, cache rebuilt")
+
+    return config_dict
+
+
+def load_ola_module():
+    """
+    import the OLA client on first use, it is only needed if the OLA input is enabled
+
+    Returns
+    -------
+    bool
+        True if the OLA python libs are available
+    """
+
+    global ClientWrapper, ola_module_present
+
+    if ola_module_present is None:
+        try:
+            from ola.ClientWrapper import ClientWrapper
+            ola_module_present = True
+        except ImportError:
+            ola_module_present = False
+
+    return ola_module_present
+
+
+def load_numpy_module():
+    """
+    import numpy which speeds up comparing and merging DMX frames
+
+    Importing numpy takes longer than all other startup steps, so it is done by
+    start_numpy_loader() in the background. Until it is loaded frames get
+    compared without numpy.
+    """
+
+    global numpy, numpy_module_present
+
+    try:
+        import numpy as numpy_module
+    except ImportError:
+        logging.debug("numpy not found, comparing DMX frames without it")
+        return
+
+    numpy = numpy_module
+    numpy_module_present = True
+
+
+def start_numpy_loader():
+    """
+    import numpy in a background thread
+    """
+
+    loader_thread = threading.Thread(target=load_numpy_module, name="numpy-loader")
+    loader_thread.daemon = True
+    loader_thread.start()
+
+
+def mark_startup_phase(phase, detail=None):
+    """
+    record the end of a startup phase if started with --startup-timing
+    """
+
+    if startup_timing is not None:
+        startup_timing.mark(phase, detail)
+
+
+def report_startup_timing():
+    """
+    log the startup report and stop recording startup phases, gets called after the first OSC message got sent
+    """
+
+    global startup_timing
+
+    if startup_timing is None:
+        return
+
+    startup_timing.mark("first OSC message")
+
+    logging.info(startup_timing.format_report())
+
+    startup_timing = None
+
+
+def split_channel_options(command):
+    """
+    split a channel definition into its command and type fields and the trailing key=value options
+
+    Parameters
+    ----------
+    command : str
+        channel definition, i.e. '/Fader:range:0:127:deadband=2'
+
+    Returns
+    -------
+    tuple
+        list of command and type fields and dict of options
+    """
+
+    command_and_type = command.split(":")
+    channel_options = dict()
+
+    while len(command_and_type) > 2 and "=" in command_and_type[-1]:
+        option_name, option_value = command_and_type.pop().split("=", 1)
+        channel_options[option_name.strip()] = option_value.strip()
+
+    return command_and_type, channel_options
+
+
+def compile_osc_destinations(mapping):
+    """
+    create one OscDestination for every OSC destination used in the channel mapping
+
+    Parameters
+    ----------
+    mapping : dict
+        universe to channel mapping as parsed from the config file
+
+    Returns
+    -------
+    dict
+        OSC destination name to OscDestination mapping
+    """
+
+    destinations = dict()
+
+    for universe_mapping in mapping.values():
+        for channel_config in universe_mapping.values():
+
+            if channel_config is None:
+                continue
+
+            for destination_config in channel_config.get("destinations"):
+                if destination_config.get("name") not in destinations:
+                    destinations[destination_config.get("name")] = OscDestination(destination_config)
+
+    return destinations
+
+
+def compile_osc_universes(mapping, destinations):
+    """
+    create the state and dispatch table of every DMX universe used in the channel mapping
+
+    Parameters
+    ----------
+    mapping : dict
+        universe to channel mapping as parsed from the config file
+    destinations : dict
+        OSC destination name to OscDestination mapping
+
+    Returns
+    -------
+    dict
+        universe number to DmxUniverse mapping
+    """
+
+    universes = dict()
+
+    for universe, universe_mapping in mapping.items():
+        universes[universe] = DmxUniverse(universe, compile_osc_dispatch_table(universe_mapping, destinations))
+
+    return universes
+
+
+def compile_osc_dispatch_table(mapping, destinations):
+    """
+    compile the parsed OSC channel mapping into a dispatch table
+
+    Parameters
+    ----------
+    mapping : dict
+        channel id to command and destinations mapping of a single universe
+    destinations : dict
+        OSC destination name to OscDestination mapping
+
+    Returns
+    -------
+    list
+        list with one entry per DMX channel, either an OscDispatchRecord or None for unmapped channels
+    """
+
+    dispatch_table = [None] * dmx_num_channels
+
+    for channel_id, channel_config in mapping.items():
+
+        # channels of a group share the record compiled for the first channel of the group
+        if channel_config is None or dispatch_table[channel_id] is not None:
+            continue
+
+        channel_ids = channel_config.get("channels")
+
+        osc_command = OscDispatchRecord(
+            channel_ids[0] + 1, channel_config.get("command"),
+            [destinations.get(d.get("name")) for d in channel_config.get("destinations")], channel_ids)
+
+        for group_channel_id in channel_ids:
+            dispatch_table[group_channel_id] = osc_command
+
+    return dispatch_table
+
+
+def do_error_exit(log_text):
+    """log an error and exit with return code 1
+    Parameters
+    ----------
+    log_text : str
+        the text to log as error
+    """
+
+    logging.error(log_text)
+    exit(1)
+
+
+def restrict_config_to_universes(config_dict, universes):
+    """
+    remove all universes and the OSC destinations only they use from a parsed config
+
+    Parameters
+    ----------
+    config_dict : dict
+        parsed config
+    universes : list
+        universes to keep
+    """
+
+    config_dict["osc.universes"] = dict((universe, dmx_universe) for universe, dmx_universe in
+                                        config_dict["osc.universes"].items() if universe in universes)
+    config_dict["osc.destinations"] = dict((destination.name, destination) for dmx_universe in
+                                           config_dict["osc.universes"].values()
+                                           for destination in dmx_universe.destinations)
+
+
+def load_reloaded_config(config_file, running_config, universes=None):
+    """
+    parse the config file again and rebuild only what changed compared to the running config
+
+    OSC destinations with unchanged options keep their socket and counters, channels
+    with an unchanged command and destinations keep their dispatch record.
+
+    Parameters
+    ----------
+    config_file : str
+        path to the config file
+    running_config : dict
+        the config currently in use
+    universes : list
+        only keep these universes, used by OSC workers
+
+    Returns
+    -------
+    dict
+        the new config, ready to be applied with apply_pending_config()
+
+    Raises
+    ------
+    ConfigError
+        if the config file can't be read or contains problems
+    """
+
+    new_config = load_own_config(config_file, args.config_cache)
+
+    for option in config_restart_options:
+        if new_config.get(option) != running_config.get(option):
+            logging.warning("Changing option '%s' requires a restart, keeping '%s'" %
+                            (option, running_config.get(option)))
+            new_config[option] = running_config.get(option)
+
+    # keep OSC destinations which didn't change
+    destinations = dict()
+    for name, destination in new_config["osc.destinations"].items():
+        running_destination = running_config["osc.destinations"].get(name)
+        if running_destination is not None and running_destination.get_settings() == destination.get_settings():
+            destination = running_destination
+        destinations[name] = destination
+
+    new_config["osc.destinations"] = destinations
+    new_config["osc.universes"] = compile_osc_universes(new_config["osc"], destinations)
+
+    if universes is not None:
+        restrict_config_to_universes(new_config, universes)
+
+    if running_config["ola-dmx.enabled"] == "1":
+        for universe in sorted(set(new_config["osc.universes"]) - set(running_config["osc.universes"])):
+            logging.warning("Receiving OLA universe '%d' requires a restart" % universe)
+
+    # keep dispatch records of unchanged channels, queued messages refer to them
+    num_changed_channels = 0
+    for universe, dmx_universe in new_config["osc.universes"].items():
+        running_universe = running_config["osc.universes"].get(universe)
+        dispatch_table = dmx_universe.dispatch_table
+
+        for channel_id, osc_command in enumerate(dispatch_table):
+            running_osc_command = None if running_universe is None else running_universe.dispatch_table[channel_id]
+
+            if osc_command is not None and running_osc_command is not None and \
+                    osc_command.command == running_osc_command.command and \
+                    osc_command.channel_ids == running_osc_command.channel_ids and \
+                    osc_command.destinations == running_osc_command.destinations:
+                dispatch_table[channel_id] = running_osc_command
+            elif osc_command is not None or running_osc_command is not None:
+                num_changed_channels += 1
+
+    for destination in new_config["osc.destinations"].values():
+        if destination.sock is None:
+            destination.connect()
+
+    logging.info("Reloaded config has %d changed channels and %d new OSC destinations" %
+                 (num_changed_channels, len([d for d in new_config["osc.destinations"].values()
+                                             if d not in running_config["osc.destinations"].values()])))
+
+    return new_config
+
+
+def apply_pending_config():
+    """
+    swap in a reloaded config
+
+    Gets called by the thread which handles the DMX frames, so a frame is never handled
+    with a partly applied config. Universes continue with their last frame, channels
+    which changed get their last value sent to their new destinations right away.
+    """
+
+    global config, pending_config
+
+    new_config = pending_config
+
+    if new_config is None:
+        return
+
+    running_config = config
+
+    for universe, dmx_universe in new_config["osc.universes"].items():
+        running_universe = running_config["osc.universes"].get(universe)
+        if running_universe is None:
+            continue
+
+        dmx_universe.take_over_state(running_universe)
+
+        if dmx_universe.last_frame_ts is None:
+            continue
+
+        queued_osc_commands = set()
+
+        for channel_id, osc_command in enumerate(dmx_universe.dispatch_table):
+            running_osc_command = running_universe.dispatch_table[channel_id]
+            if osc_command is None or osc_command is running_osc_command or osc_command in queued_osc_commands:
+                continue
+
+            queued_osc_commands.add(osc_command)
+
+            # destinations which already got this command are up to date
+            if running_osc_command is not None and running_osc_command.command == osc_command.command and \
+                    running_osc_command.channel_ids == osc_command.channel_ids:
+                skip_destinations = running_osc_command.destinations
+            else:
+                skip_destinations = tuple()
+
+            value_to_send = osc_command.get_value(dmx_universe.last_dmx_block)
+            for destination in osc_command.destinations:
+                if destination not in skip_destinations:
+                    destination.queue_message(osc_command, value_to_send)
+
+    config = new_config
+    pending_config = None
+
+    # close sockets of OSC destinations which got removed or replaced
+    for name, destination in running_config["osc.destinations"].items():
+        if new_config["osc.destinations"].get(name) is not destination:
+            destination.close()
+
+    flush_osc_destinations()
+
+    logging.info("Applied reloaded config")
+
+
+def get_config_file_mtime(config_file):
+    """
+    return modification time of the config file, None if it can't be accessed
+    """
+
+    try:
+        return os.stat(config_file).st_mtime
+    except OSError:
+        return None
+
+
+def reload_config_on_demand(config_file, watch=False, universes=None, after_reload=None):
+    """
+    reload the config file if config_reload_event is set (SIGHUP) or the file changed,
+    meant to run in a background thread
+
+    A config which fails validation is logged and the running config stays in place.
+
+    Parameters
+    ----------
+    config_file : str
+        path to the config file
+    watch : bool
+        reload if the modification time of the config file changes
+    universes : list
+        only keep these universes, used by OSC workers
+    after_reload : callable
+        gets called after a reloaded config got handed over
+    """
+
+    global pending_config
+
+    last_mtime = get_config_file_mtime(config_file)
+
+    while True:
+        triggered = config_reload_event.wait(config_watch_interval if watch is True else None)
+        config_reload_event.clear()
+
+        mtime = get_config_file_mtime(config_file)
+        if triggered is not True and mtime == last_mtime:
+            continue
+
+        last_mtime = mtime
+
+        # the previous reload needs to be applied first, it is the base of the next one
+        while pending_config is not None:
+            time.sleep(0.1)
+
+        logging.info("Reloading config file '%s'" % config_file)
+
+        try:
+            new_config = load_reloaded_config(config_file, config, universes)
+
+            # universes are assigned to OSC workers on start
+            if universes is None and args.workers > 0 and \
+                    sorted(new_config["osc.universes"]) != sorted(config["osc.universes"]):
+                raise ConfigError("adding or removing universes with --workers requires a restart")
+
+        except ConfigError as e:
+            logging.error("Config reload failed, keeping the running config: %s" % str(e))
+            continue
+        except Exception as e:
+            logging.error("Config reload failed unexpectedly, keeping the running config: %s" % str(e))
+            continue
+
+        # join multicast groups of added universes here instead of in the thread which handles the frames
+        if sacn_socket is not None:
+            join_sacn_multicast_groups(sacn_socket, [universe for universe in new_config["osc.universes"]
+                                                     if universe not in config["osc.universes"]])
+
+        pending_config = new_config
+
+        if after_reload is not None:
+            after_reload()
+
+
+def start_config_reloader(config_file, watch=False, universes=None, after_reload=None):
+    """
+    reload the config file on SIGHUP and, if requested, if it changes
+
+    Parameters are passed on to reload_config_on_demand()
+    """
+
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signal_number, frame: config_reload_event.set())
+
+    reloader_thread = threading.Thread(target=reload_config_on_demand, name="reloader",
+                                       args=(config_file, watch, universes, after_reload))
+    reloader_thread.daemon = True
+    reloader_thread.start()
+
+
+def get_dmx_frame(data):
+    """
+    return DMX data as a buffer of exactly 512 bytes
+
+    Buffers which already have the right size and int items are returned untouched.
+    Everything else is truncated/padded into a scratch buffer which is only valid
+    until the next call.
+
+    Parameters
+    ----------
+    data : memoryview, bytes, bytearray, array.array or list
+        DMX data received from the input
+
+    Returns
+    -------
+    memoryview, bytes or bytearray
+        DMX frame of 512 bytes or None if data contained invalid values
+    """
+
+    if len(data) == dmx_num_channels and isinstance(data, dmx_frame_types):
+        return data
+
+    num_channels = min(len(data), dmx_num_channels)
+
+    try:
+        dmx_frame_buffer[:num_channels] = data[:num_channels]
+    except (ValueError, TypeError) as e:
+        logging.warning("submitted DMX data contains invalid values: %s" % str(e))
+        return None
+
+    # pad DMX frame if it is truncated
+    if num_channels < dmx_num_channels:
+        dmx_frame_buffer[num_channels:] = bytearray(dmx_num_channels - num_channels)
+
+    return dmx_frame_buffer
+
+
+def get_changed_dmx_channels(data, last_block):
+    """
+    compare two DMX frames and return the ids of all channels which differ
+
+    Parameters
+    ----------
+    data : memoryview, bytes or bytearray
+        current DMX frame of 512 bytes
+    last_block : bytearray
+        previous DMX frame of 512 bytes
+
+    Returns
+    -------
+    list
+        ids of changed channels in ascending order
+    """
+
+    if numpy_module_present is True:
+        return numpy.flatnonzero(numpy.frombuffer(data, dtype=numpy.uint8) !=
+                                 numpy.frombuffer(last_block, dtype=numpy.uint8)).tolist()
+
+    if data == last_block:
+        return list()
+
+    # compare chunks first and only look at single channels of chunks which changed
+    changed_channels = list()
+    data = memoryview(data)
+    last_block = memoryview(last_block)
+    for chunk_start in range(0, dmx_num_channels, dmx_compare_chunk_size):
+        chunk_end = chunk_start + dmx_compare_chunk_size
+        if data[chunk_start:chunk_end] != last_block[chunk_start:chunk_end]:
+            changed_channels.extend([channel_id for channel_id in range(chunk_start, chunk_end)
+                                     if data[channel_id] != last_block[channel_id]])
+
+    return changed_channels
+
+
+def send_dmx_to_osc(data, universe=default_dmx_universe, flush=True):
+    """
+    send DMX data array to OSC receiver
+
+    Parameters
+    ----------
+    data : memoryview, bytes, bytearray, array.array or list
+        DMX data of up to 512 channels, missing channels are treated as 0
+    universe : int
+        the DMX universe the data belongs to
+    flush : bool
+        send messages right away, if False the messages are only queued at the
+        OSC destinations and need to be sent with OscDestination.flush()
+    """
+
+    if pending_config is not None:
+        apply_pending_config()
+
+    if startup_timing is not None:
+        startup_timing.mark("first DMX frame")
+
+    frame_start_ts = time.time()
+
+    dmx_universe = config["osc.universes"].get(universe)
+
+    # universe is not mapped to any OSC destination
+    if dmx_universe is None:
+        return
+
+    # inter-arrival time and jitter of frames
+    if dmx_universe.last_frame_ts is not None:
+        frame_interval = frame_start_ts - dmx_universe.last_frame_ts
+        metrics.frame_interval.observe(frame_interval)
+        if dmx_universe.last_frame_interval is not None:
+            metrics.frame_jitter.observe(abs(frame_interval - dmx_universe.last_frame_interval))
+        dmx_universe.last_frame_interval = frame_interval
+
+    dmx_universe.last_frame_ts = frame_start_ts
+
+    num_changed_channels = queue_dmx_frame(dmx_universe, data, flush_high_priority=flush)
+
+    if flush is True and num_changed_channels > 0:
+        # send out all messages of this frame
+        for destination in dmx_universe.destinations:
+            destination.flush()
+
+    metrics.channels_changed.observe(num_changed_channels)
+    metrics.frame_processing_time.observe(time.time() - frame_start_ts)
+
+    return
+
+
+def queue_dmx_frame(dmx_universe, data, flush_high_priority=False):
+    """
+    compare DMX data with the last frame of the universe and queue OSC messages for all changed channels
+
+    High priority channels are queued ahead of all other channels.
+
+    Parameters
+    ----------
+    dmx_universe : DmxUniverse
+        the universe the data belongs to
+    data : memoryview, bytes, bytearray, array.array or list
+        DMX data of up to 512 channels
+    flush_high_priority : bool
+        send the messages of high priority channels before the other channels get translated,
+        except to destinations with output_mode bundle
+
+    Returns
+    -------
+    int
+        number of changed channels
+    """
+
+    data = get_dmx_frame(data)
+
+    if data is None:
+        return 0
+
+    last_dmx_block = dmx_universe.last_dmx_block
+
+    changed_channels = get_changed_dmx_channels(data, last_dmx_block)
+    num_changed_channels = len(changed_channels)
+
+    if num_changed_channels == 0:
+        return 0
+
+    # triggers and toggles shouldn't wait until hundreds of faders got translated
+    changed_high_priority_channels = list()
+    high_priority_channels = dmx_universe.high_priority_channels
+    if len(high_priority_channels) > 0:
+        changed_high_priority_channels = [channel_id for channel_id in changed_channels
+                                          if channel_id in high_priority_channels]
+        if len(changed_high_priority_channels) > 0:
+            changed_channels = [channel_id for channel_id in changed_channels
+                                if channel_id not in high_priority_channels]
+
+    dispatch_table = dmx_universe.dispatch_table
+    log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    deadband_values = None
+    queued_groups = None
+
+    for channel_group in [changed_high_priority_channels, changed_channels]:
+
+        for dmx_channel_id in channel_group:
+
+            value = data[dmx_channel_id]
+            osc_command = dispatch_table[dmx_channel_id]
+
+            if osc_command is None:
+                logging.error("Received value '%d' for undefined DMX channel '%d' in universe '%d'" %
+                              (value, dmx_channel_id + 1, dmx_universe.universe))
+                continue
+
+            # ignore small changes of noisy faders, the limits of the DMX range always get through
+            if osc_command.deadband > 0 and 0 < value < 255 and \
+                    abs(value - last_dmx_block[dmx_channel_id]) < osc_command.deadband:
+                if deadband_values is None:
+                    deadband_values = list()
+                deadband_values.append((dmx_channel_id, last_dmx_block[dmx_channel_id]))
+                continue
+
+            # a channel group is sent once per frame with the values of all its channels
+            if osc_command.is_group is True:
+                if queued_groups is None:
+                    queued_groups = set()
+                elif osc_command in queued_groups:
+                    continue
+                queued_groups.add(osc_command)
+                value_to_send = osc_command.get_value(data)
+            else:
+                value_to_send = osc_command.value_table[value]
+
+            # queue osc message for all destinations
+            for destination in osc_command.destinations:
+
+                if log_debug is True:
+                    logging.debug("Sending OSC command: %s to %s" %
+                                  (osc_command.describe_value(value, value_to_send), destination.name))
+
+                destination.queue_message(osc_command, value_to_send)
+
+        # bundles of a frame are only sent once the frame is translated completely
+        if flush_high_priority is True and channel_group is changed_high_priority_channels:
+            for destination in dmx_universe.destinations:
+                if len(destination.pending_high) > 0 and destination.output_mode != "bundle":
+                    destination.flush()
+
+    last_dmx_block[:] = data
+
+    # keep the values the deadband refers to, slow drifts add up until they exceed it
+    if deadband_values is not None:
+        for dmx_channel_id, value in deadband_values:
+            last_dmx_block[dmx_channel_id] = value
+
+    return num_changed_channels
+
+
+def accept_artnet_packet(raw_data, address):
+    """
+    decode a received datagram and check if it should be sent to OSC
+
+    Parameters
+    ----------
+    raw_data : memoryview
+        the received datagram
+    address : tuple
+        address of the sender
+
+    Returns
+    -------
+    DmxFrame
+        universe and DMX data of the packet or None if the packet is not accepted
+    """
+
+    if pending_config is not None:
+        apply_pending_config()
+
+    metrics.packets_received += 1
+
+    frame = ArtnetPacket.unpack_raw_artnet_packet(raw_data)
+
+    if frame is None:
+        return None
+
+    # only accept packages for universes which are mapped to OSC destinations
+    dmx_universe = config["osc.universes"].get(frame.universe)
+    if dmx_universe is None:
+        metrics.drop_packet("wrong_universe")
+        return None
+
+    now = time.time()
+
+    source = get_artnet_source(dmx_universe, address[0], now)
+    if source is None:
+        metrics.drop_packet("wrong_source")
+        return None
+
+    drop_reason = source.check_sequence(frame.sequence)
+    if drop_reason is not None:
+        metrics.drop_packet(drop_reason)
+        return None
+
+    source.last_seen_ts = now
+
+    if config["art-net.merge_mode"] != "none":
+        frame.data = merge_artnet_frame(dmx_universe, source, frame.data)
+
+    if dmx_capture is not None:
+        dmx_capture.write_frame(frame)
+
+    return frame
+
+
+def accept_sacn_packet(raw_data, address):
+    """
+    decode a received sACN datagram and check if it should be sent to OSC
+
+    Of all sources of a universe only the highest priority is used. If several sources
+    send with the same priority, the first one is used until it stops sending.
+
+    Parameters
+    ----------
+    raw_data : memoryview
+        the received datagram
+    address : tuple
+        address of the sender
+
+    Returns
+    -------
+    DmxFrame
+        universe and DMX data of the packet or None if the packet is not accepted
+    """
+
+    if pending_config is not None:
+        apply_pending_config()
+
+    metrics.packets_received += 1
+
+    frame = SacnPacket.unpack_raw_sacn_packet(raw_data)
+
+    if frame is None:
+        return None
+
+    dmx_universe = config["osc.universes"].get(frame.universe)
+    if dmx_universe is None:
+        metrics.drop_packet("wrong_universe")
+        return None
+
+    now = time.time()
+    sources = dmx_universe.sacn_sources
+
+    # forget sources which stopped sending
+    for source in list(sources.values()):
+        if now - source.last_seen_ts > sacn_source_timeout:
+            logging.info("sACN source %s of universe %d timed out" % (source.address, dmx_universe.universe))
+            del sources[source.cid]
+
+    source = sources.get(frame.source)
+
+    if frame.options & SACN_OPTION_STREAM_TERMINATED:
+        if source is not None:
+            logging.info("sACN source %s of universe %d terminated its stream" % (address[0], dmx_universe.universe))
+            del sources[frame.source]
+        metrics.drop_packet("stream_terminated")
+        return None
+
+    if source is None:
+        logging.info("Receiving sACN packets of universe %d from %s" % (dmx_universe.universe, address[0]))
+        source = sources[frame.source] = SacnSource(frame.source, address[0], now)
+
+    drop_reason = source.check_sequence(frame.sequence)
+    if drop_reason is not None:
+        metrics.drop_packet(drop_reason)
+        return None
+
+    source.priority = frame.priority
+    source.last_seen_ts = now
+
+    highest_priority = max([s.priority for s in sources.values()])
+    if frame.priority < highest_priority:
+        metrics.drop_packet("low_priority")
+        return None
+
+    # stay with the active source as long as it sends with the highest priority
+    active_source = sources.get(dmx_universe.sacn_active_source)
+    if active_source is not None and active_source is not source and active_source.priority == highest_priority:
+        metrics.drop_packet("wrong_source")
+        return None
+
+    dmx_universe.sacn_active_source = frame.source
+
+    if dmx_capture is not None:
+        dmx_capture.write_frame(frame)
+
+    return frame
+
+
+def get_artnet_source(dmx_universe, address, now):
+    """
+    return the state of an Art-Net sender of a universe
+
+    Senders which haven't sent a packet within the source timeout are forgotten. Without
+    merging, only packets of a single sender are accepted per universe, other senders take
+    over once it timed out.
+
+    Parameters
+    ----------
+    dmx_universe : DmxUniverse
+        the universe the packet belongs to
+    address : str
+        IP address of the sender
+    now : float
+        time the packet got received
+
+    Returns
+    -------
+    ArtnetSource
+        the sender state or None if packets of this sender are not accepted
+    """
+
+    sources = dmx_universe.sources
+    source_timeout = config["art-net.source_timeout"]
+
+    for source in list(sources.values()):
+        if now - source.last_seen_ts > source_timeout:
+            logging.info("Art-Net sender %s of universe %d timed out" % (source.address, dmx_universe.universe))
+            del sources[source.address]
+
+    source = sources.get(address)
+
+    if source is not None:
+        return source
+
+    if config["art-net.merge_mode"] == "none":
+        max_sources = 1
+    else:
+        max_sources = config["art-net.merge_sources"]
+
+    if len(sources) >= max_sources:
+        return None
+
+    logging.info("Accepting Art-Net packets of universe %d from %s" % (dmx_universe.universe, address))
+
+    source = sources[address] = ArtnetSource(address, now)
+
+    return source
+
+
+def merge_artnet_frame(dmx_universe, source, data):
+    """
+    merge DMX data of a sender with the frames of all other senders of the universe
+
+    Parameters
+    ----------
+    dmx_universe : DmxUniverse
+        the universe the packet belongs to
+    source : ArtnetSource
+        the sender of the packet
+    data : memoryview
+        DMX data of the packet
+
+    Returns
+    -------
+    bytearray
+        the merged DMX frame of the universe
+    """
+
+    frame = get_dmx_frame(data)
+    merged_frame = dmx_universe.merged_frame
+
+    if frame is None:
+        return merged_frame
+
+    if config["art-net.merge_mode"] == "ltp":
+        # channels which changed since the previous packet of this sender take precedence,
+        # a new sender takes over all channels
+        if source.frame is None:
+            merged_frame[:] = frame
+        else:
+            for dmx_channel_id in get_changed_dmx_channels(frame, source.frame):
+                merged_frame[dmx_channel_id] = frame[dmx_channel_id]
+
+    if source.frame is None:
+        source.frame = bytearray(dmx_num_channels)
+
+    source.frame[:] = frame
+
+    if config["art-net.merge_mode"] == "htp":
+        source_frames = [s.frame for s in dmx_universe.sources.values() if s.frame is not None]
+
+        if len(source_frames) == 1:
+            merged_frame[:] = frame
+        elif numpy_module_present is True:
+            merged_values = numpy.frombuffer(merged_frame, dtype=numpy.uint8)
+            merged_values[:] = numpy.frombuffer(source_frames[0], dtype=numpy.uint8)
+            for source_frame in source_frames[1:]:
+                numpy.maximum(merged_values, numpy.frombuffer(source_frame, dtype=numpy.uint8), out=merged_values)
+        else:
+            merged_frame[:] = bytearray(map(max, *source_frames))
+
+    return merged_frame
+
+
+def receive_ola_frame(data, universe=default_dmx_universe):
+    """
+    callback of the OLA client, captures the frame if requested and sends it to OSC
+    """
+
+    frame = DmxFrame(universe, data)
+
+    if dmx_capture is not None:
+        dmx_capture.write_frame(frame)
+
+    send_dmx_to_osc(frame.data, frame.universe)
+
+
+class DmxCapture(object):
+    """
+    append-only capture file of all accepted DMX frames
+
+    Every frame is stored as a record with timestamp and universe and only the channels
+    which changed since the previous frame of the same universe.
+
+    Parameters
+    ----------
+    file_name : str
+        path of the capture file, an existing capture gets appended to
+    """
+
+    __slots__ = ("file_name", "handle", "last_frames", "last_flush_ts", "num_frames", "num_bytes")
+
+    def __init__(self, file_name):
+
+        self.file_name = file_name
+        self.last_frames = dict()
+        self.last_flush_ts = time.time()
+        self.num_frames = 0
+        self.num_bytes = 0
+
+        file_exists = os.path.exists(file_name) and os.path.getsize(file_name) > 0
+
+        if file_exists is True:
+            with open(file_name, "rb") as capture_file:
+                if capture_file.read(len(capture_file_magic)) != capture_file_magic:
+                    raise ValueError("'%s' is not a DMX capture file" % file_name)
+
+        self.handle = open(file_name, "ab")
+
+        if file_exists is False:
+            self.handle.write(capture_file_magic)
+
+        self.handle.write(pack(capture_record_format, CAPTURE_RECORD_SESSION, time.time(), 0, 0))
+
+    def write_frame(self, dmx_frame):
+        """
+        append a frame to the capture file
+
+        Parameters
+        ----------
+        dmx_frame : DmxFrame
+            the accepted frame
+        """
+
+        universe = dmx_frame.universe
+        frame = get_dmx_frame(dmx_frame.data)
+
+        if frame is None:
+            return
+
+        last_frame = self.last_frames.get(universe)
+        if last_frame is None:
+            last_frame = self.last_frames[universe] = bytearray(dmx_num_channels)
+
+        # collect runs of changed channels
+        runs = list()
+        for dmx_channel_id in get_changed_dmx_channels(frame, last_frame):
+            if len(runs) > 0 and dmx_channel_id - runs[-1][1] <= capture_run_merge_gap:
+                runs[-1][1] = dmx_channel_id + 1
+            else:
+                runs.append([dmx_channel_id, dmx_channel_id + 1])
+
+        payload = b"".join([pack(capture_run_format, start, end - start) + bytes(frame[start:end])
+                            for start, end in runs])
+
+        now = time.time()
+
+        self.handle.write(pack(capture_record_format, CAPTURE_RECORD_FRAME, now, universe, len(payload)) + payload)
+
+        last_frame[:] = frame
+        self.num_frames += 1
+        self.num_bytes += capture_record_size + len(payload)
+
+        if now - self.last_flush_ts >= capture_flush_interval:
+            self.handle.flush()
+            self.last_flush_ts = now
+
+    def close(self):
+
+        if self.handle.closed is True:
+            return
+
+        self.handle.close()
+
+        logging.info("Captured %d frames (%d bytes) to '%s'" % (self.num_frames, self.num_bytes, self.file_name))
+
+
+def read_dmx_capture(capture):
+    """
+    iterate over all records of a capture file
+
+    Parameters
+    ----------
+    capture : mmap.mmap, bytes or bytearray
+        content of the capture file
+
+    Returns
+    -------
+    generator
+        tuples of record type, timestamp, universe and the restored DMX frame. The frame
+        is the same bytearray for every record of a universe and only valid until the next record.
+    """
+
+    if capture[:len(capture_file_magic)] != capture_file_magic:
+        raise ValueError("not a DMX capture file")
+
+    frames = dict()
+    position = len(capture_file_magic)
+
+    while position + capture_record_size <= len(capture):
+
+        record_type, timestamp, universe, payload_length = unpack_from(capture_record_format, capture, position)
+        position += capture_record_size
+
+        if position + payload_length > len(capture):
+            logging.warning("Capture file ends with an incomplete record")
+            return
+
+        if record_type == CAPTURE_RECORD_SESSION:
+            frames = dict()
+            yield record_type, timestamp, universe, None
+            continue
+
+        frame = frames.get(universe)
+        if frame is None:
+            frame = frames[universe] = bytearray(dmx_num_channels)
+
+        payload_end = position + payload_length
+        while position < payload_end:
+            start, length = unpack_from(capture_run_format, capture, position)
+            position += capture_run_size
+            if start + length > dmx_num_channels or position + length > payload_end:
+                raise ValueError("corrupt frame record")
+            frame[start:start + length] = capture[position:position + length]
+            position += length
+
+        yield record_type, timestamp, universe, frame
+
+
+def replay_dmx_capture(file_name, speed=1.0):
+    """
+    send all frames of a capture file to the OSC destinations
+
+    Parameters
+    ----------
+    file_name : str
+        path of the capture file
+    speed : float
+        replay speed factor, 1 replays with the original timing, 0 as fast as possible
+    """
+
+    import mmap
+
+    try:
+        with open(file_name, "rb") as capture_file:
+            capture = mmap.mmap(capture_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError) as e:
+        do_error_exit("Unable to open capture file '%s': %s" % (file_name, str(e)))
+        return
+
+    logging.info("Replaying '%s' %s" % (file_name, "as fast as possible" if speed == 0 else "at %sx speed" % speed))
+
+    replay_start_ts = time.time()
+    session_start_ts = None
+    session_replay_ts = None
+    num_frames = 0
+
+    try:
+        for record_type, timestamp, universe, frame in read_dmx_capture(capture):
+
+            if record_type == CAPTURE_RECORD_SESSION:
+                session_start_ts = timestamp
+                session_replay_ts = time.time()
+                continue
+
+            if speed > 0:
+                # wait for the frame time, send coalesced updates of rate limited destinations in the meantime
+                frame_ts = session_replay_ts + (timestamp - session_start_ts) / speed
+                while True:
+                    delay = frame_ts - time.time()
+                    if delay <= 0:
+                        break
+                    time.sleep(get_osc_tick_interval(delay))
+                    flush_osc_destinations()
+
+            send_dmx_to_osc(frame, universe)
+            num_frames += 1
+
+        # send remaining updates of rate limited destinations
+        flush_interval = get_osc_tick_interval()
+        if flush_interval is not None:
+            time.sleep(flush_interval)
+            flush_osc_destinations()
+
+    except ValueError as e:
+        logging.error("Replaying capture file '%s' failed: %s" % (file_name, str(e)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        capture.close()
+
+    logging.info("Replayed %d frames in %0.2f seconds" % (num_frames, time.time() - replay_start_ts))
+
+    log_osc_destination_stats()
+
+
+class DatagramReceiver(object):
+    """
+    reads all datagrams queued on a non-blocking socket into preallocated buffers
+
+    Uses a single recvmmsg syscall per batch if available, otherwise one recvfrom_into per datagram.
+    The returned datagrams are views of the buffers and only valid until the next call.
+    """
+
+    __slots__ = ("batch_size", "buffer", "views", "c_buffer", "names", "io_vectors", "messages", "addresses")
+
+    def __init__(self, batch_size=receive_batch_size):
+
+        self.batch_size = batch_size
+        self.buffer = bytearray(batch_size * receive_datagram_size)
+
+        buffer_view = memoryview(self.buffer)
+        self.views = [buffer_view[index * receive_datagram_size:(index + 1) * receive_datagram_size]
+                      for index in range(batch_size)]
+
+        # raw sender address to address tuple cache, avoids formatting the address of every datagram
+        self.addresses = dict()
+
+        if libc_recvmmsg is None:
+            return
+
+        self.c_buffer = (ctypes.c_char * len(self.buffer)).from_buffer(self.buffer)
+        self.names = (SockAddrIn * batch_size)()
+        self.io_vectors = (IoVec * batch_size)()
+        self.messages = (MMsgHdr * batch_size)()
+
+        for index in range(batch_size):
+            self.io_vectors[index].iov_base = ctypes.addressof(self.c_buffer) + index * receive_datagram_size
+            self.io_vectors[index].iov_len = receive_datagram_size
+            self.messages[index].msg_hdr.msg_name = ctypes.addressof(self.names[index])
+            self.messages[index].msg_hdr.msg_namelen = ctypes.sizeof(SockAddrIn)
+            self.messages[index].msg_hdr.msg_iov = ctypes.addressof(self.io_vectors[index])
+            self.messages[index].msg_hdr.msg_iovlen = 1
+
+    def receive(self, sock):
+        """
+        read up to batch_size datagrams without blocking
+
+        Parameters
+        ----------
+        sock : socket
+            non-blocking UDP socket
+
+        Returns
+        -------
+        list
+            tuples of datagram (memoryview) and sender address
+        """
+
+        datagrams = list()
+
+        if libc_recvmmsg is None:
+            for view in self.views:
+                try:
+                    num_bytes, address = sock.recvfrom_into(view)
+                except (timeout, IOError):
+                    break
+                datagrams.append((view[:num_bytes], address))
+            return datagrams
+
+        num_datagrams = libc_recvmmsg(sock.fileno(), self.messages, self.batch_size, MSG_DONTWAIT, None)
+
+        if num_datagrams < 0:
+            error_number = ctypes.get_errno()
+            if error_number in [errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR]:
+                return datagrams
+            raise OSError(error_number, os.strerror(error_number))
+
+        for index in range(num_datagrams):
+            message = self.messages[index]
+
+            raw_address = ctypes.string_at(message.msg_hdr.msg_name, 8)
+            address = self.addresses.get(raw_address)
+            if address is None:
+                name = self.names[index]
+                address = ("%d.%d.%d.%d" % tuple(name.sin_addr), name.sin_port[0] << 8 | name.sin_port[1])
+                self.addresses[raw_address] = address
+
+            # address length is updated by the kernel
+            message.msg_hdr.msg_namelen = ctypes.sizeof(SockAddrIn)
+
+            datagrams.append((self.views[index][:message.msg_len], address))
+
+        return datagrams
+
+
+def set_receive_buffer_size(sock, size):
+    """
+    set the receive buffer size of an input socket, a size of 0 keeps the system default
+    """
+
+    if size == 0:
+        return
+
+    sock.setsockopt(SOL_SOCKET, SO_RCVBUF, size)
+
+    # Linux doubles the requested size and limits it to net.core.rmem_max
+    logging.info("Receive buffer size of socket on port %d: %d bytes (requested %d)" %
+                 (sock.getsockname()[1], sock.getsockopt(SOL_SOCKET, SO_RCVBUF), size))
+
+
+def open_artnet_socket():
+    """
+    return the bound Art-Net socket
+    """
+
+    logging.info("Art-Net server listening on {0}:{1}".format(
+        config["art-net.listen_address"], artnet_udp_port))
+
+    sock = socket(AF_INET, SOCK_DGRAM)  # UDP
+    sock.bind((config["art-net.listen_address"], artnet_udp_port))
+
+    set_receive_buffer_size(sock, config["art-net.receive_buffer_size"])
+
+    return sock
+
+
+def open_sacn_socket():
+    """
+    return the sACN socket which joined the multicast groups of all mapped universes
+    """
+
+    global sacn_socket
+
+    sock = socket(AF_INET, SOCK_DGRAM)  # UDP
+    # allow other instances on this host to receive the same universes
+    sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+    sock.bind(("", sacn_udp_port))
+
+    set_receive_buffer_size(sock, config["sacn.receive_buffer_size"])
+
+    join_sacn_multicast_groups(sock, config["osc.universes"])
+
+    sacn_socket = sock
+
+    return sock
+
+
+def join_sacn_multicast_groups(sock, universes):
+    """
+    join the sACN multicast groups of the universes on the sACN socket
+
+    A group which can't be joined, i.e. because the max number of memberships per socket
+    (net.ipv4.igmp_max_memberships) is reached, is logged and skipped. Its universe can
+    still be received by unicast.
+    """
+
+    for universe in sorted(universes):
+        if universe < sacn_min_universe or universe > sacn_max_universe:
+            logging.warning("Universe '%d' is not a valid sACN universe, not joining its multicast group" % universe)
+            continue
+
+        multicast_group = "239.255.%d.%d" % (universe >> 8, universe & 0xff)
+        try:
+            sock.setsockopt(IPPROTO_IP, IP_ADD_MEMBERSHIP,
+                            inet_aton(multicast_group) + inet_aton(config["sacn.listen_address"]))
+        except (IOError, OSError) as e:
+            logging.error("Unable to join sACN multicast group %s on %s for universe %d: %s" %
+                          (multicast_group, config["sacn.listen_address"], universe, str(e)))
+            continue
+
+        logging.info("sACN receiver joined {0} on {1} for universe {2}".format(
+            multicast_group, config["sacn.listen_address"], universe))
+
+
+def open_dmx_input_sockets():
+    """
+    open the sockets of all enabled network inputs
+
+    Returns
+    -------
+    list
+        tuples of socket and the function to accept packets received on it
+    """
+
+    input_sockets = list()
+
+    if config["art-net.enabled"] == "1":
+        input_sockets.append((open_artnet_socket(), accept_artnet_packet))
+
+    if config["sacn.enabled"] == "1":
+        input_sockets.append((open_sacn_socket(), accept_sacn_packet))
+
+    mark_startup_phase("inputs opened")
+
+    # numpy competes with the startup for the interpreter, import it once the inputs are open
+    start_numpy_loader()
+
+    return input_sockets
+
+
+def start_dmx_listener(frame_handler=None, tick_handler=None, tick_interval=None, stop_handler=None):
+    """
+        listen for Art-Net and sACN packages and send to OSC destination
+
+    Parameters
+    ----------
+    frame_handler : callable
+        gets called with DMX data and universe of every accepted packet, default: send_dmx_to_osc
+    tick_handler : callable
+        gets called after every received packet and every tick_interval seconds, default: flush_osc_destinations
+    tick_interval : float
+        max seconds between calls of tick_handler, default: recomputed on every loop from the queued
+        messages and the update intervals of the OSC destinations
+    stop_handler : callable
+        gets called before exiting, default: log_osc_destination_stats
+    """
+
+    if frame_handler is None:
+        frame_handler = send_dmx_to_osc
+    if tick_handler is None:
+        tick_handler = flush_osc_destinations
+    if stop_handler is None:
+        stop_handler = log_osc_destination_stats
+
+    input_sockets = open_dmx_input_sockets()
+    accept_functions = dict(input_sockets)
+    sockets = [sock for sock, _ in input_sockets]
+
+    for sock in sockets:
+        sock.setblocking(False)
+
+    receiver = DatagramReceiver()
+
+    # latest frame of every universe received while draining the sockets
+    frame_slots = dict()
+    updated_universes = list()
+
+    while True:
+        try:
+            # wake up regularly to call tick handler if no packets arrive, a reload
+            # or a full send buffer may have changed when the destinations are due
+            timeout = tick_interval
+            if timeout is None:
+                timeout = get_osc_tick_interval()
+
+            readable_sockets = select.select(sockets, [], [], timeout)[0]
+
+            # drain all queued packets before handling frames, so after a stall only
+            # the latest frame of every universe gets translated instead of the whole backlog
+            num_received = 0
+            for sock in readable_sockets:
+                accept_packet = accept_functions[sock]
+
+                while num_received < receive_drain_limit:
+                    datagrams = receiver.receive(sock)
+                    num_received += len(datagrams)
+
+                    for raw_data, address in datagrams:
+                        dmx_frame = accept_packet(raw_data, address)
+
+                        if dmx_frame is None:
+                            continue
+
+                        universe = dmx_frame.universe
+
+                        frame = get_dmx_frame(dmx_frame.data)
+                        if frame is None:
+                            continue
+
+                        frame_slot = frame_slots.get(universe)
+                        if frame_slot is None:
+                            frame_slot = frame_slots[universe] = bytearray(dmx_num_channels)
+
+                        if universe in updated_universes:
+                            metrics.frames_superseded += 1
+                        else:
+                            updated_universes.append(universe)
+
+                        frame_slot[:] = frame
+
+                    if len(datagrams) < receiver.batch_size:
+                        break
+
+            if num_received > 0:
+                metrics.packets_per_receive.observe(num_received)
+
+            for universe in updated_universes:
+                frame_handler(frame_slots[universe], universe)
+
+            del updated_universes[:]
+
+            tick_handler()
+
+        except KeyboardInterrupt:
+            for sock in sockets:
+                sock.close()
+            stop_handler()
+            exit(0)
+
+
+class OscWorkerPool(object):
+    """
+    pool of worker processes which translate DMX frames and send them to the OSC destinations
+
+    Universes are distributed round robin across the workers. The receiving process writes
+    every accepted frame into a shared memory slot of its universe and notifies the owning
+    worker through a pipe. A newer frame overwrites the slot, so a busy worker only picks up
+    the latest frame of a universe. Every slot is guarded by a sequence counter which is odd
+    while the slot is being written.
+
+    Workers get the parsed config of the receiving process, so a restarted worker uses the
+    running config even if the config file changed in the meantime. The pipes are written
+    non-blocking, if the pipe of a busy worker is full the receiving process keeps the
+    updated slots and notifies the worker with the next frame or supervise() call.
+    """
+
+    def __init__(self, num_workers, config_file, worker_args):
+
+        import multiprocessing
+
+        universes = sorted(config["osc.universes"])
+
+        self.num_workers = max(1, min(num_workers, len(universes)))
+        self.config_file = config_file
+        self.worker_args = worker_args
+
+        self.universe_slots = dict((universe, slot) for slot, universe in enumerate(universes))
+        self.universe_workers = dict((universe, slot % self.num_workers) for slot, universe in enumerate(universes))
+        self.slot_messages = [pack("!H", slot) for slot in range(len(universes))]
+
+        self.frames = multiprocessing.RawArray("B", max(1, len(universes)) * dmx_num_channels)
+        # ctypes arrays export the format '<B', cast to plain bytes to allow slice assignment
+        self.frames_view = memoryview(self.frames).cast("B")
+        self.sequences = multiprocessing.RawArray("L", max(1, len(universes)))
+
+        self.workers = [None] * self.num_workers
+        self.connections = [None] * self.num_workers
+        # updated slots per worker which didn't fit into its pipe
+        self.unsent_slots = [set() for _ in range(self.num_workers)]
+        self.last_supervise_ts = 0
+
+    def start_worker(self, worker_id):
+        """
+        start (or restart) a single worker process
+        """
+
+        import multiprocessing
+
+        universe_slots = dict((universe, slot) for universe, slot in self.universe_slots.items()
+                              if self.universe_workers[universe] == worker_id)
+
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        # a message of a slot number is written atomically or not at all
+        os.set_blocking(writer.fileno(), False)
+
+        worker = multiprocessing.Process(target=run_osc_worker, name="osc-worker-%d" % worker_id,
+                                         args=(worker_id, universe_slots, self.frames, self.sequences, reader,
+                                               get_parsed_config(config), self.config_file, self.worker_args))
+        worker.daemon = True
+        worker.start()
+        reader.close()
+
+        # a restarted worker continues with the latest frames of its universes
+        if self.connections[worker_id] is not None:
+            self.connections[worker_id].close()
+            self.unsent_slots[worker_id] = set(slot for slot in universe_slots.values() if self.sequences[slot] > 0)
+
+        self.workers[worker_id] = worker
+        self.connections[worker_id] = writer
+
+        self.notify_worker(worker_id)
+
+        logging.info("Started OSC worker %d (pid %d) for universes: %s" %
+                     (worker_id, worker.pid, ", ".join([str(u) for u in sorted(universe_slots)])))
+
+    def start(self):
+        """
+        start all worker processes
+        """
+
+        for worker_id in range(self.num_workers):
+            self.start_worker(worker_id)
+
+    def dispatch_frame(self, data, universe):
+        """
+        write frame into the shared memory slot of its universe and notify the owning worker
+        """
+
+        frame = get_dmx_frame(data)
+
+        if frame is None:
+            return
+
+        slot = self.universe_slots[universe]
+        slot_start = slot * dmx_num_channels
+
+        self.sequences[slot] += 1
+        self.frames_view[slot_start:slot_start + dmx_num_channels] = frame
+        self.sequences[slot] += 1
+
+        worker_id = self.universe_workers[universe]
+
+        self.unsent_slots[worker_id].add(slot)
+        self.notify_worker(worker_id)
+
+    def notify_worker(self, worker_id):
+        """
+        send the numbers of all updated slots to a worker, never blocks, slots which
+        don't fit into the pipe stay in unsent_slots
+        """
+
+        unsent_slots = self.unsent_slots[worker_id]
+
+        while len(unsent_slots) > 0:
+            slot = unsent_slots.pop()
+
+            try:
+                self.connections[worker_id].send_bytes(self.slot_messages[slot])
+            except (OSError, IOError) as e:
+                if e.errno in [errno.EAGAIN, errno.EWOULDBLOCK]:
+                    unsent_slots.add(slot)
+                    return
+                # worker died, gets restarted by supervise()
+                unsent_slots.clear()
+                return
+            except ValueError:
+                unsent_slots.clear()
+                return
+
+    def supervise(self):
+        """
+        restart crashed workers and notify busy ones about slots which didn't fit into their pipe,
+        checks at most every osc_worker_supervise_interval seconds
+        """
+
+        now = time.time()
+        if now - self.last_supervise_ts < osc_worker_supervise_interval:
+            return
+
+        self.last_supervise_ts = now
+
+        for worker_id, worker in enumerate(self.workers):
+            if worker.is_alive() is False:
+                logging.warning("OSC worker %d exited with code %s, restarting" % (worker_id, str(worker.exitcode)))
+                self.start_worker(worker_id)
+            else:
+                self.notify_worker(worker_id)
+
+    def reload_workers(self):
+        """
+        let all worker processes reload the config file
+        """
+
+        for worker in self.workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signal.SIGHUP)
+
+    def stop(self):
+        """
+        stop all worker processes
+        """
+
+        for worker_id, worker in enumerate(self.workers):
+            self.connections[worker_id].close()
+            worker.join(osc_worker_supervise_interval)
+            if worker.is_alive():
+                worker.terminate()
+
+
+def read_shared_frame(frames_view, sequences, slot, frame):
+    """
+    copy the frame of a shared memory slot, retries if the slot got written in the meantime
+    """
+
+    slot_start = slot * dmx_num_channels
+
+    while True:
+        sequence = sequences[slot]
+        if sequence & 1:
+            continue
+
+        frame[:] = frames_view[slot_start:slot_start + dmx_num_channels]
+
+        if sequences[slot] == sequence:
+            return
+
+
+def run_osc_worker(worker_id, universe_slots, frames, sequences, connection, parsed_config, config_file,
+                   worker_args):
+    """
+    main function of an OSC worker process
+
+    The worker compiles the parsed config of the receiving process and only keeps the
+    universes and OSC destinations it is responsible for.
+
+    Parameters
+    ----------
+    worker_id : int
+        number of this worker
+    universe_slots : dict
+        universe to shared memory slot mapping of all universes handled by this worker
+    frames : multiprocessing.RawArray
+        shared memory with one frame slot per universe
+    sequences : multiprocessing.RawArray
+        sequence counter per frame slot
+    connection : multiprocessing.Connection
+        pipe the receiving process sends the numbers of updated slots to
+    parsed_config : dict
+        running config of the receiving process without compiled items, see get_parsed_config()
+    config_file : str
+        path to the config file, reloaded on SIGHUP
+    worker_args : argparse.Namespace
+        command line arguments
+    """
+
+    global config, args, osc_datagram_cache, metrics
+
+    args = worker_args
+
+    # forked from the receiving process, start with own metrics
+    metrics = Metrics()
+
+    if args.osc_cache_size > 0:
+        osc_datagram_cache = OscDatagramCache(args.osc_cache_size)
+
+    logging.basicConfig(level="DEBUG" if args.verbose else "INFO",
+                        format='%(asctime)s - %(levelname)s: %(message)s')
+
+    config = compile_config(parsed_config)
+
+    restrict_config_to_universes(config, universe_slots)
+
+    if numpy_module_present is False:
+        start_numpy_loader()
+
+    connect_osc_destinations()
+
+    # the receiving process forwards SIGHUP after it reloaded the config successfully
+    start_config_reloader(config_file, universes=list(universe_slots))
+
+    resolver_thread = threading.Thread(target=resolve_osc_destinations, name="resolver")
+    resolver_thread.daemon = True
+    resolver_thread.start()
+
+    # only summary logging, the HTTP endpoint is served by the receiving process
+    if config["metrics.log_interval"] > 0 or args.profile is True:
+        config["metrics.enabled"] = "0"
+        start_metrics()
+
+    slot_universes = dict((slot, universe) for universe, slot in universe_slots.items())
+    frames_view = memoryview(frames).cast("B")
+    frame = bytearray(dmx_num_channels)
+    parent_pid = os.getppid()
+
+    try:
+        while os.getppid() == parent_pid:
+            # wake up regularly to notice if the receiving process is gone, other workers
+            # inherit our pipe and keep it open, so EOF alone isn't reliable
+            if connection.poll(get_osc_tick_interval(osc_worker_supervise_interval)) is True:
+
+                # collect all slots which got updated, every slot only needs to be read once
+                updated_slots = set()
+                while connection.poll(0) is True:
+                    updated_slots.add(unpack("!H", connection.recv_bytes())[0])
+
+                for slot in updated_slots:
+                    read_shared_frame(frames_view, sequences, slot, frame)
+                    send_dmx_to_osc(frame, slot_universes[slot], flush=False)
+
+            flush_osc_destinations()
+
+    except (KeyboardInterrupt, EOFError):
+        log_osc_destination_stats()
+
+
+def start_worker_pool(num_workers):
+    """
+        listen for Art-Net and sACN packages and hand them to a pool of OSC worker processes
+    """
+
+    pool = OscWorkerPool(num_workers, args.config_file, args)
+    pool.start()
+
+    metrics.output_enabled = False
+
+    start_config_reloader(args.config_file, args.watch_config, after_reload=pool.reload_workers)
+
+    start_dmx_listener(frame_handler=pool.dispatch_frame, tick_handler=pool.supervise,
+                       tick_interval=osc_worker_supervise_interval, stop_handler=pool.stop)
+
+
+def start_asyncio_listener():
+    """
+        listen for Art-Net and sACN packages and send to OSC destinations with the asyncio engine
+    """
+
+    try:
+        import dmx_to_osc_asyncio
+    except (ImportError, SyntaxError) as e:
+        do_error_exit("Unable to load asyncio engine: %s" % str(e))
+
+    logging.info("Starting asyncio engine")
+
+    try:
+        dmx_to_osc_asyncio.run_dmx_engine(
+            open_dmx_input_sockets(),
+            translate_frame=functools.partial(send_dmx_to_osc, flush=False),
+            receive_datagrams=DatagramReceiver().receive,
+            frame_superseded=metrics.supersede_frame,
+            get_destinations=lambda: config["osc.destinations"])
+    except KeyboardInterrupt:
+        log_osc_destination_stats()
+        exit(0)
+
+
+if __name__ == "__main__":
+
+    # parse command line
+    args = parse_command_line()
+
+    # set log level
+    if args.verbose:
+        log_level = "DEBUG"
+    else:
+        log_level = "INFO"
+
+    logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s: %(message)s')
+
+    if args.startup_timing is True:
+        startup_timing = StartupTiming(script_start_ts)
+        startup_timing.mark("imports")
+
+    # parse config data
+    try:
+        config = load_own_config(args.config_file, args.config_cache)
+    except ConfigError as e:
+        do_error_exit(str(e))
+
+    if config["ola-dmx.enabled"] == "1" and args.asyncio is True:
+        do_error_exit("The asyncio engine only supports Art-Net and sACN input, disable OLA input to use it.")
+
+    if config["ola-dmx.enabled"] == "1" and args.workers > 0:
+        do_error_exit("OSC workers only support Art-Net and sACN input, disable OLA input to use them.")
+
+    if args.asyncio is True and args.workers > 0:
+        do_error_exit("The asyncio engine and OSC workers can't be combined.")
+
+    if args.replay is not None and (args.capture is not None or args.asyncio is True or args.workers > 0):
+        do_error_exit("Replaying a capture file can't be combined with --capture, --asyncio or --workers.")
+
+    if args.replay_speed < 0:
+        do_error_exit("Replay speed must not be negative.")
+
+    if args.osc_cache_size < 0:
+        do_error_exit("OSC cache size must not be negative.")
+
+    if args.osc_cache_size > 0:
+        osc_datagram_cache = OscDatagramCache(args.osc_cache_size)
+
+    if args.capture is not None:
+        try:
+            dmx_capture = DmxCapture(args.capture)
+        except (IOError, OSError, ValueError) as e:
+            do_error_exit("Unable to open capture file '%s': %s" % (args.capture, str(e)))
+        atexit.register(dmx_capture.close)
+        logging.info("Capturing DMX frames to '%s'" % args.capture)
+
+    start_metrics()
+
+    # open sockets to OSC destinations and keep their addresses up to date, workers open their own
+    if args.workers == 0:
+        connect_osc_destinations()
+
+        mark_startup_phase("OSC destinations connected")
+
+        resolver_thread = threading.Thread(target=resolve_osc_destinations, name="resolver")
+        resolver_thread.daemon = True
+        resolver_thread.start()
+
+    # workers get reloaded by the receiving process
+    if args.workers == 0:
+        start_config_reloader(args.config_file, args.watch_config)
+
+    # replay a capture file instead of listening to the inputs
+    if args.replay is not None:
+        start_numpy_loader()
+        replay_dmx_capture(args.replay, args.replay_speed)
+
+    # register and run ola DMX client
+    elif config["ola-dmx.enabled"] == "1":
+        logging.info("Starting DMX to OSC with OLA client")
         wrapper = ClientWrapper()
         client = wrapper.Client()
-        client.RegisterUniverse(int(config["ola-dmx.universe"]), client.REGISTER, send_dmx_to_osc)
-        wrapper.Run()
-    elif config["art-net.enabled"] == "1":
-        start_artnet_listener()
+        for ola_universe in sorted(config["osc.universes"]):
+            client.RegisterUniverse(ola_universe, client.REGISTER,
+                                    functools.partial(receive_ola_frame, universe=ola_universe))
+
+        mark_startup_phase("inputs opened")
+
+        start_numpy_loader()
+
+        # send coalesced updates of rate limited destinations and deferred messages if no frames arrive
+        def flush_osc_destinations_event():
+            flush_osc_destinations()
+            flush_interval = get_osc_tick_interval(ola_flush_check_interval)
+            wrapper.AddEvent(max(1, int(flush_interval * 1000)), flush_osc_destinations_event)
+
+        flush_osc_destinations_event()
+
+        try:
+            wrapper.Run()
+        except KeyboardInterrupt:
+            log_osc_destination_stats()
+    elif "1" in [config["art-net.enabled"], config["sacn.enabled"]] and args.asyncio is True:
+        start_asyncio_listener()
+    elif "1" in [config["art-net.enabled"], config["sacn.enabled"]] and args.workers > 0:
+        start_worker_pool(args.workers)
+    elif "1" in [config["art-net.enabled"], config["sacn.enabled"]]:
+        start_dmx_listener()
     else:
         do_error_exit("No input method in config file defined/enabled.")
 
-exit(0)
+    exit(0)
 
 # EOF
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+asyncio engine of dmx_to_osc
+
+Receiving Art-Net/sACN and sending OSC messages are decoupled. Input sockets are
+drained completely whenever they become readable and received frames are stored
+in a slot per universe where a newer frame replaces an older one which hasn't
+been translated yet. Every OSC destination is served by its own sender
+task, so a slow destination never blocks the receive path.
+
+This module is python 3 only and gets loaded by dmx_to_osc.py if started with --asyncio.
+"""
+
+#################
+#   imports
+
+import asyncio
+import logging
+
+
+class DmxEngine(object):
+    """
+    asyncio runtime which receives Art-Net/sACN, translates frames and sends OSC messages
+
+    Parameters
+    ----------
+    translate_frame : callable
+        gets called with DMX data and universe and queues OSC messages at the destinations
+    get_destinations : callable
+        returns a dict of all currently configured OSC destinations
+    receive_datagrams : callable
+        gets called with a readable non-blocking socket and returns a list of tuples of
+        received datagram and sender address, the datagrams are only valid until the next call
+    frame_superseded : callable
+        gets called if a frame gets replaced by a newer frame of the same universe before it got translated
+    """
+
+    # max number of datagrams read from a socket before the event loop continues
+    drain_limit = 1024
+    # seconds to wait before retrying to send messages which didn't fit into the send buffer
+    send_retry_interval = 0.001
+
+    def __init__(self, translate_frame, get_destinations, receive_datagrams, frame_superseded=None):
+
+        self.translate_frame = translate_frame
+        self.get_destinations = get_destinations
+        self.receive_datagrams = receive_datagrams
+        self.frame_superseded = frame_superseded
+
+        # newest frame per universe which hasn't been translated yet
+        self.frame_slots = dict()
+        self.frames_pending = None
+
+        self.sender_events = dict()
+        self.sender_tasks = dict()
+
+    def read_socket(self, sock, accept_packet):
+        """
+        drain a readable input socket and put the newest frame of every universe into its slot
+
+        Parameters
+        ----------
+        sock : socket
+            the readable input socket
+        accept_packet : callable
+            gets called with the datagram (memoryview) and sender address, returns a
+            DmxFrame or None if the packet should be ignored
+        """
+
+        num_received = 0
+
+        while num_received < self.drain_limit:
+            try:
+                datagrams = self.receive_datagrams(sock)
+            except OSError as e:
+                logging.warning("DMX input socket error: %s" % str(e))
+                return
+
+            if len(datagrams) == 0:
+                break
+
+            num_received += len(datagrams)
+
+            for data, address in datagrams:
+
+                frame = accept_packet(data, address)
+
+                if frame is None:
+                    continue
+
+                if frame.universe in self.frame_slots and self.frame_superseded is not None:
+                    self.frame_superseded()
+
+                # received datagrams get overwritten by the next read
+                self.frame_slots[frame.universe] = bytes(frame.data)
+
+        if len(self.frame_slots) > 0:
+            self.frames_pending.set()
+
+    async def translate_frames(self):
+        """
+        translate all pending frames and wake up the senders of destinations with queued messages
+        """
+
+        while True:
+            await self.frames_pending.wait()
+            self.frames_pending.clear()
+
+            frame_slots = self.frame_slots
+            self.frame_slots = dict()
+
+            for universe, frame in frame_slots.items():
+                try:
+                    self.translate_frame(frame, universe)
+                except Exception as e:
+                    logging.error("Translating frame of universe '%d' failed: %s" % (universe, str(e)))
+
+            self.wake_senders()
+
+    def wake_senders(self):
+        """
+        wake up sender tasks of all destinations with queued messages, start missing sender tasks
+        """
+
+        for destination in self.get_destinations().values():
+
+            if destination.has_pending() is False:
+                continue
+
+            if destination not in self.sender_events:
+                self.sender_events[destination] = asyncio.Event()
+                self.sender_tasks[destination] = asyncio.ensure_future(self.send_to_destination(destination))
+
+            self.sender_events[destination].set()
+
+    async def send_to_destination(self, destination):
+        """
+        sender task of a single OSC destination
+        """
+
+        event = self.sender_events[destination]
+
+        while True:
+            await event.wait()
+            event.clear()
+
+            # rate limited or paused destination, updates arriving in the meantime get coalesced
+            flush_delay = destination.get_flush_delay()
+            if flush_delay > 0:
+                await asyncio.sleep(flush_delay)
+
+            try:
+                destination.flush()
+            except Exception as e:
+                logging.error("Sending to OSC destination '%s' failed: %s" % (destination.name, str(e)))
+
+            # messages held back by max_rate or a full send buffer
+            if destination.has_pending() is True:
+                if destination.get_flush_delay() == 0:
+                    await asyncio.sleep(self.send_retry_interval)
+                event.set()
+
+    async def run(self, input_sockets):
+        """
+        receive from the input sockets and run until cancelled
+        """
+
+        loop = asyncio.get_running_loop()
+
+        self.frames_pending = asyncio.Event()
+
+        for sock, accept_packet in input_sockets:
+            sock.setblocking(False)
+            loop.add_reader(sock.fileno(), self.read_socket, sock, accept_packet)
+
+        try:
+            await self.translate_frames()
+        finally:
+            for sock, _ in input_sockets:
+                loop.remove_reader(sock.fileno())
+                sock.close()
+            for task in self.sender_tasks.values():
+                task.cancel()
+
+
+def run_dmx_engine(input_sockets, translate_frame, get_destinations, receive_datagrams, frame_superseded=None):
+    """
+    run the asyncio engine until interrupted
+
+    Parameters
+    ----------
+    input_sockets : list
+        tuples of a bound UDP socket and the function which accepts packets received on it,
+        see DmxEngine.read_socket
+    translate_frame : callable
+        see DmxEngine
+    get_destinations : callable
+        see DmxEngine
+    receive_datagrams : callable
+        see DmxEngine
+    frame_superseded : callable
+        see DmxEngine
+    """
+
+    engine = DmxEngine(translate_frame, get_destinations, receive_datagrams, frame_superseded)
+
+    asyncio.run(engine.run(input_sockets))
+
+# EOF
@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+benchmark harness for dmx_to_osc
+
+    run     start dmx_to_osc.py with a generated config, send synthetic Art-Net to it and
+            receive the OSC messages with a local sink. Reports frames/s, OSC messages/s,
+            end-to-end latency and dropped frames.
+    sender  send synthetic Art-Net frames to a running dmx_to_osc instance
+    sink    receive OSC messages and report messages/s
+    micro   microbenchmarks of the Art-Net decoder and send_dmx_to_osc
+
+End-to-end latency is measured with a marker: channel 1 of every universe carries the
+frame number + 1 (mod 256) and is mapped to an OSC message of type "value", so the sink
+can tell which frame a message belongs to.
+"""
+
+#################
+#   imports
+
+import argparse
+import bisect
+import multiprocessing
+import os
+import random
+import selectors
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+#################
+#   default and internal vars
+
+artnet_udp_port = 6454
+artnet_header = b"Art-Net\x00"
+artnet_dmx_header = struct.Struct("!8sHHBBBBH")
+dmx_num_channels = 512
+
+default_sink_port = 9000
+default_fps = 44
+default_duration = 10
+default_universes = 1
+default_pattern = "fade"
+
+patterns = ["static", "fade", "flicker"]
+# share of channels changed per frame with pattern "flicker"
+flicker_share = 0.1
+
+bench_osc_address_prefix = b"/bench/"
+osc_int = struct.Struct(">i")
+
+
+def build_artnet_packet(universe, sequence, data):
+    """
+    return an ArtDmx packet
+    """
+
+    return artnet_dmx_header.pack(artnet_header, 0x0050, 14, sequence, 0, universe & 0xff, universe >> 8,
+                                  len(data)) + bytes(data)
+
+
+class FrameGenerator(object):
+    """
+    generates DMX frames of one universe according to a change pattern
+
+    Channel 1 always carries the marker (frame number + 1) mod 256 unless the pattern is "static".
+    The offset makes sure the first frame differs from the initial all zero state of the receiver.
+    """
+
+    def __init__(self, pattern, seed=None):
+
+        self.pattern = pattern
+        self.frame = bytearray(dmx_num_channels)
+        self.random = random.Random(seed)
+
+    def next_frame(self, frame_number):
+
+        if self.pattern == "fade":
+            value = (frame_number + 1) & 0xff
+            self.frame[:] = bytes([value]) * dmx_num_channels
+        elif self.pattern == "flicker":
+            for _ in range(int(dmx_num_channels * flicker_share)):
+                self.frame[self.random.randrange(1, dmx_num_channels)] = self.random.randrange(256)
+            self.frame[0] = (frame_number + 1) & 0xff
+
+        return self.frame
+
+
+def run_sender(target, universes, fps, pattern, duration, start_universe=0):
+    """
+    send synthetic Art-Net frames
+
+    Returns
+    -------
+    dict
+        universe to list of send timestamps (index is the frame number)
+    """
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    generators = [FrameGenerator(pattern, seed=universe) for universe in range(universes)]
+    send_times = dict((start_universe + universe, list()) for universe in range(universes))
+
+    interval = 1.0 / fps
+    num_frames = int(duration * fps)
+    start = time.time()
+
+    for frame_number in range(num_frames):
+
+        # keep schedule, frames which are late are sent right away
+        delay = start + frame_number * interval - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+        # sequence 0 means "sequence disabled", use 1 - 255
+        sequence = frame_number % 255 + 1
+
+        for index, generator in enumerate(generators):
+            universe = start_universe + index
+            packet = build_artnet_packet(universe, sequence, generator.next_frame(frame_number))
+            send_times[universe].append(time.time())
+            sock.sendto(packet, target)
+
+    sock.close()
+
+    return send_times
+
+
+def parse_osc_packet(data, messages):
+    """
+    minimal OSC decoder, appends (address, first int argument) of every message to messages
+    """
+
+    if data[:8] == b"#bundle\x00":
+        offset = 16
+        while offset + 4 <= len(data):
+            size = osc_int.unpack_from(data, offset)[0]
+            parse_osc_packet(data[offset + 4:offset + 4 + size], messages)
+            offset += 4 + size
+        return
+
+    address_end = data.find(b"\x00")
+    if address_end < 0:
+        return
+
+    tags_start = (address_end + 4) & ~3
+    tags_end = data.find(b"\x00", tags_start)
+    if tags_end < 0:
+        return
+
+    value = None
+    if data[tags_start + 1:tags_start + 2] == b"i":
+        value = osc_int.unpack_from(data, (tags_end + 4) & ~3)[0]
+
+    messages.append((data[:address_end], value))
+
+
+def run_sink(ports, duration, result_connection=None, report_interval=None):
+    """
+    receive OSC messages and record arrival times of marker messages
+
+    Returns
+    -------
+    dict
+        number of datagrams and messages received and list of marker arrivals (universe, value, timestamp)
+    """
+
+    sockets = list()
+    for port in ports:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
+        sock.bind(("127.0.0.1", port))
+        sock.setblocking(False)
+        sockets.append(sock)
+
+    selector = selectors.DefaultSelector()
+    for sock in sockets:
+        selector.register(sock, selectors.EVENT_READ)
+
+    result = {"datagrams": 0, "messages": 0, "markers": list()}
+    marker_suffix = b"/1"
+
+    if result_connection is not None:
+        result_connection.send("ready")
+
+    end = time.time() + duration
+    last_report_ts = time.time()
+    last_report_messages = 0
+
+    while time.time() < end:
+        for key, _ in selector.select(timeout=0.1):
+            while True:
+                try:
+                    data = key.fileobj.recv(65535)
+                except BlockingIOError:
+                    break
+
+                now = time.time()
+                messages = list()
+                parse_osc_packet(data, messages)
+
+                result["datagrams"] += 1
+                result["messages"] += len(messages)
+
+                for address, value in messages:
+                    if address.startswith(bench_osc_address_prefix) and address.endswith(marker_suffix):
+                        universe = int(address[len(bench_osc_address_prefix):-len(marker_suffix)])
+                        result["markers"].append((universe, value, now))
+
+        if report_interval is not None and time.time() - last_report_ts >= report_interval:
+            print("%0.0f OSC msgs/s" % ((result["messages"] - last_report_messages) /
+                                        (time.time() - last_report_ts)))
+            last_report_ts = time.time()
+            last_report_messages = result["messages"]
+
+    for sock in sockets:
+        sock.close()
+
+    if result_connection is not None:
+        result_connection.send(result)
+
+    return result
+
+
+def percentile(values, share):
+    """
+    return the value below which the given share of sorted values falls
+    """
+
+    if len(values) == 0:
+        return None
+
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def evaluate_latency(send_times, markers):
+    """
+    match marker arrivals with the frames they belong to
+
+    Returns
+    -------
+    tuple
+        sorted list of latencies in seconds and number of frames whose marker arrived
+    """
+
+    latencies = list()
+    received_frames = set()
+
+    for universe, value, arrival_ts in markers:
+        universe_send_times = send_times.get(universe)
+        if universe_send_times is None or value is None:
+            continue
+
+        # the latest frame with this marker sent before the message arrived
+        frame_numbers = range((value - 1) & 0xff, len(universe_send_times), 256)
+        frame_send_times = [universe_send_times[n] for n in frame_numbers]
+        index = bisect.bisect_right(frame_send_times, arrival_ts) - 1
+        if index < 0:
+            continue
+
+        frame_number = frame_numbers[index]
+        if (universe, frame_number) in received_frames:
+            continue
+
+        received_frames.add((universe, frame_number))
+        latencies.append(arrival_ts - frame_send_times[index])
+
+    return sorted(latencies), len(received_frames)
+
+
+def get_process_cpu_time(pid):
+    """
+    return CPU seconds used by a process and its children (Linux only), None if not available
+    """
+
+    pids = [pid]
+    try:
+        for entry in os.listdir("/proc"):
+            if entry.isdigit() is False:
+                continue
+            try:
+                with open("/proc/%s/stat" % entry) as stat_file:
+                    fields = stat_file.read().rsplit(")", 1)[1].split()
+                if int(fields[1]) == pid:
+                    pids.append(int(entry))
+            except (IOError, OSError, IndexError):
+                continue
+
+        cpu_ticks = 0
+        for process_id in pids:
+            with open("/proc/%d/stat" % process_id) as stat_file:
+                fields = stat_file.read().rsplit(")", 1)[1].split()
+            cpu_ticks += int(fields[11]) + int(fields[12])
+    except (IOError, OSError, IndexError, ValueError):
+        return None
+
+    return float(cpu_ticks) / os.sysconf("SC_CLK_TCK")
+
+
+def write_bench_config(path, universes, destinations, sink_port, output_mode, start_universe=0):
+    """
+    write a config mapping all channels of all universes as "value" to the sink ports
+    """
+
+    lines = ["[art-net]", "enabled = 1", "listen_address = 127.0.0.1", "universe = %d" % start_universe, "",
+             "[ola-dmx]", "enabled = 0", ""]
+
+    for universe in range(start_universe, start_universe + universes):
+        for destination in range(destinations):
+            lines.extend(["[osc/bench-u%d-d%d]" % (universe, destination),
+                          "server = 127.0.0.1",
+                          "port = %d" % (sink_port + destination),
+                          "universe = %d" % universe,
+                          "output_mode = %s" % output_mode])
+            lines.extend(["channel_%d = /bench/%d/%d:value" % (channel, universe, channel)
+                          for channel in range(1, dmx_num_channels + 1)])
+            lines.append("")
+
+    with open(path, "w") as config_file:
+        config_file.write("\n".join(lines))
+
+
+def command_run(args):
+    """
+    end-to-end benchmark of a dmx_to_osc.py process
+    """
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_fd, config_path = tempfile.mkstemp(prefix="dmx_to_osc_bench_", suffix=".ini")
+    os.close(config_fd)
+
+    write_bench_config(config_path, args.universes, args.destinations, args.sink_port, args.output_mode)
+
+    sink_ports = [args.sink_port + destination for destination in range(args.destinations)]
+    sink_duration = args.warmup + args.duration + args.drain
+
+    result_reader, result_writer = multiprocessing.Pipe(duplex=False)
+    sink = multiprocessing.Process(target=run_sink, args=(sink_ports, sink_duration, result_writer))
+    sink.start()
+    result_reader.recv()
+
+    bridge_log = open(os.devnull, "w") if args.bridge_log is None else open(args.bridge_log, "w")
+    bridge = subprocess.Popen([sys.executable, os.path.join(script_dir, "dmx_to_osc.py"), "-c", config_path] +
+                              args.bridge_args.split(), stderr=bridge_log, stdout=bridge_log)
+
+    try:
+        time.sleep(args.warmup)
+
+        cpu_start = get_process_cpu_time(bridge.pid)
+        send_times = run_sender(("127.0.0.1", artnet_udp_port), args.universes, args.fps, args.pattern,
+                                args.duration)
+        cpu_end = get_process_cpu_time(bridge.pid)
+
+        sink_result = result_reader.recv()
+        sink.join()
+    finally:
+        bridge.terminate()
+        bridge.wait()
+        bridge_log.close()
+        os.unlink(config_path)
+
+    frames_sent = sum(len(times) for times in send_times.values())
+    latencies, frames_received = evaluate_latency(send_times, sink_result["markers"])
+
+    print("universes: %d, destinations: %d, pattern: %s, fps: %d, duration: %ds, bridge args: '%s'" %
+          (args.universes, args.destinations, args.pattern, args.fps, args.duration, args.bridge_args))
+    print("frames sent:        %d (%0.1f frames/s)" % (frames_sent, frames_sent / float(args.duration)))
+    print("OSC messages:       %d (%0.1f msgs/s) in %d datagrams" %
+          (sink_result["messages"], sink_result["messages"] / float(args.duration), sink_result["datagrams"]))
+
+    if args.pattern == "static":
+        print("latency:            n/a for pattern 'static'")
+    else:
+        print("frames received:    %d, dropped: %d" % (frames_received, frames_sent - frames_received))
+        if len(latencies) > 0:
+            print("latency:            p50 %0.2f ms, p99 %0.2f ms, max %0.2f ms" %
+                  (percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000, latencies[-1] * 1000))
+
+    if cpu_start is not None and cpu_end is not None:
+        print("bridge CPU:         %0.1f%%" % ((cpu_end - cpu_start) / float(args.duration) * 100))
+
+
+def command_sender(args):
+    """
+    send synthetic Art-Net frames to a running dmx_to_osc instance
+    """
+
+    send_times = run_sender((args.target, artnet_udp_port), args.universes, args.fps, args.pattern,
+                            args.duration, args.start_universe)
+
+    frames_sent = sum(len(times) for times in send_times.values())
+    print("frames sent: %d (%0.1f frames/s)" % (frames_sent, frames_sent / float(args.duration)))
+
+
+def command_sink(args):
+    """
+    receive OSC messages and report the message rate
+    """
+
+    result = run_sink([args.sink_port + port for port in range(args.ports)], args.duration, report_interval=1.0)
+
+    print("OSC messages: %d in %d datagrams" % (result["messages"], result["datagrams"]))
+
+
+def command_micro(args):
+    """
+    microbenchmarks of the Art-Net decoder and send_dmx_to_osc
+    """
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import dmx_to_osc
+    import logging
+
+    logging.basicConfig(level="WARNING")
+
+    # send_dmx_to_osc, messages are sent to a socket which is never read
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+
+    config_fd, config_path = tempfile.mkstemp(prefix="dmx_to_osc_bench_", suffix=".ini")
+    os.close(config_fd)
+    write_bench_config(config_path, 1, args.destinations, sink.getsockname()[1], args.output_mode)
+
+    try:
+        dmx_to_osc.args = argparse.Namespace(profile=False, verbose=False)
+        dmx_to_osc.config = dmx_to_osc.parse_own_config(config_path)
+        dmx_to_osc.load_numpy_module()
+    finally:
+        os.unlink(config_path)
+
+    dmx_to_osc.connect_osc_destinations()
+
+    if args.osc_cache_size > 0:
+        dmx_to_osc.osc_datagram_cache = dmx_to_osc.OscDatagramCache(args.osc_cache_size)
+
+    # decoder, with sequence 0 every packet gets accepted
+    iterations = args.iterations * 10
+    sender = ("127.0.0.1", artnet_udp_port)
+    packets = [
+        ("ArtDmx", dmx_to_osc.ArtnetPacket.unpack_raw_artnet_packet,
+         build_artnet_packet(0, 0, bytes(bytearray(range(256)) * 2))),
+        ("ArtPoll rejected", dmx_to_osc.ArtnetPacket.unpack_raw_artnet_packet,
+         artnet_header + struct.pack("!HHBB", 0x2000, 14, 0, 0)),
+        ("ArtDmx accepted", lambda raw_data: dmx_to_osc.accept_artnet_packet(raw_data, sender),
+         build_artnet_packet(0, 0, bytes(bytearray(range(256)) * 2))),
+    ]
+
+    for name, decode, packet in packets:
+        packet = memoryview(packet)
+        decode_time = timeit.timeit(lambda: decode(packet), number=iterations)
+        print("decode (%s): %0.2f us/packet (%0.0f packets/s)" %
+              (name, decode_time / iterations * 1e6, iterations / decode_time))
+
+    for pattern in patterns:
+        generator = FrameGenerator(pattern, seed=0)
+        frames = [bytes(generator.next_frame(frame_number)) for frame_number in range(args.iterations)]
+        frame_iterator = iter(frames * 2)
+
+        # prime last frame
+        dmx_to_osc.send_dmx_to_osc(frames[-1], 0)
+
+        run_time = timeit.timeit(lambda: dmx_to_osc.send_dmx_to_osc(next(frame_iterator), 0),
+                                 number=args.iterations)
+        print("send_dmx_to_osc (%s): %0.2f us/frame (%0.0f frames/s)" %
+              (pattern, run_time / args.iterations * 1e6, args.iterations / run_time))
+
+    sink.close()
+
+
+def parse_command_line():
+    """parse command line arguments
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    def add_frame_options(subparser):
+        subparser.add_argument("--universes", type=int, default=default_universes,
+                               help="number of universes to send (default: %d)" % default_universes)
+        subparser.add_argument("--fps", type=int, default=default_fps,
+                               help="frames per second and universe (default: %d)" % default_fps)
+        subparser.add_argument("--pattern", choices=patterns, default=default_pattern,
+                               help="change pattern of the frames (default: %s)" % default_pattern)
+        subparser.add_argument("--duration", type=int, default=default_duration,
+                               help="seconds to send frames (default: %d)" % default_duration)
+
+    run_parser = subparsers.add_parser("run", help="end-to-end benchmark of dmx_to_osc.py")
+    add_frame_options(run_parser)
+    run_parser.add_argument("--destinations", type=int, default=1,
+                            help="number of OSC destinations per universe (default: 1)")
+    run_parser.add_argument("--output-mode", choices=["message", "bundle"], default="message",
+                            help="output mode of the OSC destinations (default: message)")
+    run_parser.add_argument("--sink-port", type=int, default=default_sink_port,
+                            help="first UDP port of the OSC sink (default: %d)" % default_sink_port)
+    run_parser.add_argument("--bridge-args", default="",
+                            help="additional command line arguments for dmx_to_osc.py, i.e. '--asyncio'")
+    run_parser.add_argument("--bridge-log", help="write output of dmx_to_osc.py to this file")
+    run_parser.add_argument("--warmup", type=float, default=2.0,
+                            help="seconds to wait for dmx_to_osc.py to start (default: 2)")
+    run_parser.add_argument("--drain", type=float, default=1.0,
+                            help="seconds to wait for late OSC messages (default: 1)")
+    run_parser.set_defaults(func=command_run)
+
+    sender_parser = subparsers.add_parser("sender", help="send synthetic Art-Net frames")
+    add_frame_options(sender_parser)
+    sender_parser.add_argument("--target", default="127.0.0.1", help="Art-Net receiver (default: 127.0.0.1)")
+    sender_parser.add_argument("--start-universe", type=int, default=0, help="first universe (default: 0)")
+    sender_parser.set_defaults(func=command_sender)
+
+    sink_parser = subparsers.add_parser("sink", help="receive OSC messages and report messages/s")
+    sink_parser.add_argument("--sink-port", type=int, default=default_sink_port,
+                             help="first UDP port to listen on (default: %d)" % default_sink_port)
+    sink_parser.add_argument("--ports", type=int, default=1, help="number of UDP ports to listen on (default: 1)")
+    sink_parser.add_argument("--duration", type=int, default=default_duration,
+                             help="seconds to receive (default: %d)" % default_duration)
+    sink_parser.set_defaults(func=command_sink)
+
+    micro_parser = subparsers.add_parser("micro", help="microbenchmarks of decoder and send_dmx_to_osc")
+    micro_parser.add_argument("--iterations", type=int, default=2000,
+                              help="number of frames per pattern (default: 2000)")
+    micro_parser.add_argument("--destinations", type=int, default=1,
+                              help="number of OSC destinations (default: 1)")
+    micro_parser.add_argument("--osc-cache-size", type=int, default=0,
+                              help="size of the LRU cache of encoded OSC messages (default: 0 = disabled)")
+    micro_parser.add_argument("--output-mode", choices=["message", "bundle"], default="message",
+                              help="output mode of the OSC destinations (default: message)")
+    micro_parser.set_defaults(func=command_micro)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    parsed_args = parse_command_line()
+    parsed_args.func(parsed_args)
+
+# EOF